@@ -0,0 +1,250 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from sleeper_api_wrapper import SleeperAPI
+from sleeper_index import DraftIndex, LeagueIndex
+
+
+class AsyncSleeperAPI:
+    """
+    asyncio twin of SleeperAPI. Every endpoint method is a coroutine, and at most
+    max_concurrency requests are in flight at once.
+
+    Requests are issued through the wrapped SleeperAPI on a dedicated thread pool, so
+    the response cache and the players table are shared with synchronous callers. Give the
+    wrapped client a pool_size of at least max_concurrency so no worker waits for a session.
+
+    Args:
+        api (SleeperAPI, optional): The client to issue requests through (default is a new SleeperAPI()).
+        max_concurrency (int, optional): Maximum number of concurrent requests (default is 8).
+
+    Example:
+        >>> async with AsyncSleeperAPI(SleeperAPI(), max_concurrency=16) as aapi:
+        ...     trades = await aapi.get_all_trades_in_leagues(["1182986456149786624", "1080545431282696192"])
+    """
+
+    def __init__(self, api: Optional[SleeperAPI] = None, max_concurrency: int = 8):
+        self.api = api if api is not None else SleeperAPI()
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="sleeper")
+
+    async def __aenter__(self) -> "AsyncSleeperAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    async def _get(self, path: str) -> Any:
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self.api._get, path)
+
+    # -------------------------
+    # USER ENDPOINTS
+    # -------------------------
+
+    async def get_user(self, username: str) -> Dict[str, Any]:
+        """Async version of SleeperAPI.get_user."""
+        return await self._get(f"/user/{username}")
+
+    async def get_user_leagues(self, user_id: str, season: int, sport: str = "nfl") -> List[Dict[str, Any]]:
+        """Async version of SleeperAPI.get_user_leagues."""
+        return await self._get(f"/user/{user_id}/leagues/{sport}/{season}")
+
+    async def get_user_drafts(self, user_id: str, sport: str = "nfl") -> List[Dict[str, Any]]:
+        """Async version of SleeperAPI.get_user_drafts."""
+        return await self._get(f"/user/{user_id}/drafts/{sport}")
+
+    # -------------------------
+    # LEAGUE ENDPOINTS
+    # -------------------------
+
+    async def get_league(self, league_id: str) -> Dict[str, Any]:
+        """Async version of SleeperAPI.get_league."""
+        return await self._get(f"/league/{league_id}")
+
+    async def get_league_users(self, league_id: str) -> List[Dict[str, Any]]:
+        """Async version of SleeperAPI.get_league_users."""
+        return await self._get(f"/league/{league_id}/users")
+
+    async def get_league_rosters(self, league_id: str) -> List[Dict[str, Any]]:
+        """Async version of SleeperAPI.get_league_rosters."""
+        return await self._get(f"/league/{league_id}/rosters")
+
+    async def get_league_matchups(self, league_id: str, week: int) -> List[Dict[str, Any]]:
+        """Async version of SleeperAPI.get_league_matchups."""
+        return await self._get(f"/league/{league_id}/matchups/{week}")
+
+    async def get_league_transactions(self, league_id: str, week: int) -> List[Dict[str, Any]]:
+        """Async version of SleeperAPI.get_league_transactions."""
+        return await self._get(f"/league/{league_id}/transactions/{week}")
+
+    async def get_league_winners_bracket(self, league_id: str):
+        """Async version of SleeperAPI.get_league_winners_bracket."""
+        return await self._get(f"/league/{league_id}/winners_bracket")
+
+    async def get_league_losers_bracket(self, league_id: str):
+        """Async version of SleeperAPI.get_league_losers_bracket."""
+        return await self._get(f"/league/{league_id}/losers_bracket")
+
+    # -------------------------
+    # DRAFT ENDPOINTS
+    # -------------------------
+
+    async def get_draft(self, draft_id: str) -> Dict[str, Any]:
+        """Async version of SleeperAPI.get_draft."""
+        return await self._get(f"/draft/{draft_id}")
+
+    async def get_draft_picks(self, draft_id: str) -> List[Dict[str, Any]]:
+        """Async version of SleeperAPI.get_draft_picks."""
+        return await self._get(f"/draft/{draft_id}/picks")
+
+    async def get_draft_traded_picks(self, draft_id: str) -> List[Dict[str, Any]]:
+        """Async version of SleeperAPI.get_draft_traded_picks."""
+        return await self._get(f"/draft/{draft_id}/traded_picks")
+
+    # -------------------------
+    # PLAYERS ENDPOINTS
+    # -------------------------
+
+    async def get_players(self, sport: str = "nfl") -> Dict[str, Any]:
+        """Async version of SleeperAPI.get_players."""
+        return await self._get(f"/players/{sport}")
+
+    async def get_trending_players(self, sport: str = "nfl", type_: str = "add", lookback_hours: int = 24):
+        """Async version of SleeperAPI.get_trending_players."""
+        return await self._get(f"/players/{sport}/trending/{type_}?lookback_hours={lookback_hours}")
+
+    # -------------------------
+    # STATE & OTHER ENDPOINTS
+    # -------------------------
+
+    async def get_state(self, sport: str = "nfl") -> Dict[str, Any]:
+        """Async version of SleeperAPI.get_state."""
+        return await self._get(f"/state/{sport}")
+
+    async def get_drafts_for_league(self, league_id: str) -> List[Dict[str, Any]]:
+        """Async version of SleeperAPI.get_drafts_for_league."""
+        return await self._get(f"/league/{league_id}/drafts")
+
+    def get_avatar_url(self, avatar_id: str) -> str:
+        """Same as SleeperAPI.get_avatar_url (no request is made)."""
+        return self.api.get_avatar_url(avatar_id)
+
+    # ======================================================================
+    # HIGH-VALUE HELPER FUNCTIONS (COMBINE MULTIPLE ENDPOINTS)
+    # ======================================================================
+    def get_player_name_from_id(self, player_id: str) -> Optional[str]:
+        """Same as SleeperAPI.get_player_name_from_id (reads the shared players table)."""
+        return self.api.get_player_name_from_id(player_id)
+
+    async def _load_players(self) -> None:
+        # name lookups are synchronous, so load the players table off the event loop first
+        if self.api._player_index is None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, self.api.players)
+
+    async def get_all_previous_league_ids(self, current_id: str) -> Dict[str, str]:
+        """Async version of SleeperAPI.get_all_previous_league_ids."""
+        league = await self.get_league(current_id)
+        all_ids = {league.get("season"): current_id}
+        while league.get("previous_league_id"):
+            previous_id = league.get("previous_league_id")
+            league = await self.get_league(previous_id)
+            all_ids[league.get("season")] = previous_id
+        return all_ids
+
+    async def get_all_previous_drafts(self, current_league_id: str) -> Dict[str, List[str]]:
+        """
+        Async version of SleeperAPI.get_all_previous_drafts.
+
+        The previous_league_id chain has to be walked one league at a time, but the drafts
+        of each season are requested as soon as its league ID is known.
+        """
+        league_id = current_league_id
+        seasons = []
+        draft_tasks = []
+        while league_id:
+            draft_tasks.append(asyncio.ensure_future(self.get_drafts_for_league(league_id)))
+            league = await self.get_league(league_id)
+            seasons.append(league.get("season"))
+            league_id = league.get("previous_league_id")
+        draft_lists = await asyncio.gather(*draft_tasks)
+        return {season: [d["draft_id"] for d in draft_list or []] for season, draft_list in zip(seasons, draft_lists)}
+
+    async def get_player_drafted_with_pick(self, draft_id: str, draft_pick: Dict[str, Any]) -> Dict[str, Any]:
+        """Async version of SleeperAPI.get_player_drafted_with_pick."""
+        index, _ = await asyncio.gather(self.get_draft_index(draft_id), self._load_players())
+        return index.resolve(draft_pick, self.get_player_name_from_id)
+
+    async def get_draft_index(self, draft_id: Optional[str]) -> DraftIndex:
+        """
+        Async version of SleeperAPI.get_draft_index. The draft and its picks are fetched concurrently,
+        and the index is shared with the wrapped SleeperAPI.
+        """
+        index = self.api._draft_indexes.get(draft_id)
+        if index is None:
+            if draft_id is None:
+                index = DraftIndex(None, None, [])
+            else:
+                draft, picks = await asyncio.gather(self.get_draft(draft_id), self.get_draft_picks(draft_id))
+                index = DraftIndex(draft_id, draft, picks)
+            self.api._draft_indexes[draft_id] = index
+        return index
+
+    async def get_all_trades_in_leagues(self, league_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Async version of SleeperAPI.get_all_trades_in_leagues. All (league, week) pages are
+        requested concurrently; trades are returned in the same (league, week) order.
+        """
+        pages = await asyncio.gather(*[
+            self.get_league_transactions(league_id, week=i)
+            for league_id in league_ids
+            for i in range(1, 25)
+        ])
+        return [trade for trades in pages for trade in trades or [] if trade["type"] == "trade"]
+
+    async def get_league_index(self, league_id: str) -> LeagueIndex:
+        """
+        Async version of SleeperAPI.get_league_index. Rosters and users are fetched concurrently,
+        and the index is shared with the wrapped SleeperAPI.
+        """
+        index = self.api._league_indexes.get(league_id)
+        if index is None:
+            rosters, users = await asyncio.gather(self.get_league_rosters(league_id), self.get_league_users(league_id))
+            index = LeagueIndex(league_id, rosters, users)
+            self.api._league_indexes[league_id] = index
+        return index
+
+    async def get_roster_name_by_roster_id(self, league_id: str, roster_id: str) -> Optional[str]:
+        """Async version of SleeperAPI.get_roster_name_by_roster_id."""
+        return (await self.get_league_index(league_id)).display_name(roster_id)
+
+    async def get_trade_info(self, trade: Dict[str, Any], current_league_id: str, drafts: Dict[str, str]) -> dict[Any, Any]:
+        """
+        Async version of SleeperAPI.get_trade_info.
+
+        The league index, every draft referenced by the trade's picks and the players table are
+        fetched concurrently up front, then the trade is resolved in memory.
+        """
+        draft_ids = {drafts.get(pick.get("season")) for pick in trade.get("draft_picks") or []}
+        index, _, *draft_indexes = await asyncio.gather(
+            self.get_league_index(current_league_id),
+            self._load_players(),
+            *[self.get_draft_index(draft_id) for draft_id in draft_ids],
+        )
+        by_draft = {draft_index.draft_id: draft_index for draft_index in draft_indexes}
+        return self.api._build_trade_info(
+            trade,
+            lambda pick: by_draft[drafts.get(pick.get("season"))].resolve(pick, self.get_player_name_from_id),
+            index.display_name,
+        )
+
+    async def user_from_id(self, user_id: str, league_id: str) -> Dict[str, Any]:
+        """Async version of SleeperAPI.user_from_id."""
+        return (await self.get_league_index(league_id)).user(user_id)
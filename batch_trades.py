@@ -0,0 +1,153 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import sleeper_codec
+from dankest import LEAGUES, build_trades, default_ktc_path, load_values
+from rate_limiter import DEFAULT_REQUESTS_PER_MINUTE
+from sleeper_api_wrapper import BASE, DEFAULT_MAX_WORKERS, SleeperAPI
+from sleeper_cache import ResponseCache
+from sleeper_replay import FixtureStore, ReplayAdapter
+from trade_sync import TradeSyncStore
+from value_index import ValueIndex
+
+# Build trades for many leagues in one process. Every league goes through the same SleeperAPI,
+# so they share its response cache, session pool, rate limit budget and players table, and the
+# KTC value index is built once. Overlapping work (the players table, completed seasons already
+# in the cache) is paid for once instead of once per league.
+#
+#   python batch_trades.py dankest chicks
+#   python batch_trades.py --config leagues.json --output-dir out --league-workers 4
+#
+# A config file is a JSON list of league configs like dankest.CHICKS, each with a "name":
+#   [{"name": "chicks", "current_league_id": "1204869865995771904"}, ...]
+
+DEFAULT_LEAGUE_WORKERS = 4
+
+
+def resolve_leagues(names: List[str], config_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Turn league names (see dankest.LEAGUES), bare league IDs and an optional config file into
+    a list of league configs, each with a name.
+    """
+    leagues = []
+    for name in names:
+        if name in LEAGUES:
+            leagues.append({"name": name, **LEAGUES[name]})
+        elif name.isdigit():
+            leagues.append({"name": name, "current_league_id": name})
+        else:
+            raise ValueError(f"Unknown league {name!r}: use one of {', '.join(sorted(LEAGUES))} or a league ID")
+    if config_path:
+        for league in sleeper_codec.load(config_path):
+            leagues.append({"name": league.get("name", league["current_league_id"]), **league})
+    names_seen = set()
+    for league in leagues:
+        if league["name"] in names_seen:
+            raise ValueError(f"League {league['name']!r} is listed twice")
+        names_seen.add(league["name"])
+    return leagues
+
+
+def run_batch(api: SleeperAPI, leagues: List[Dict[str, Any]], values: ValueIndex, output_dir: str = ".",
+              league_workers: int = DEFAULT_LEAGUE_WORKERS, incremental: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Build and write trades_<name>.json (plus unmatched_<name>.json, the traded players without a
+    KTC value, resolved_<name>.json, the trades before valuation for dankest.revalue_trades, and
+    summary_<name>.json, the per-team summary) for every league, league_workers leagues at a time.
+
+    A failing league does not stop the others; its error is reported in the result.
+
+    Args:
+        api (SleeperAPI): The shared client.
+        leagues (List[Dict[str, Any]]): League configs with a name (see resolve_leagues).
+        values (ValueIndex): Shared KTC values (see dankest.load_values).
+        output_dir (str, optional): Where the per-league files go (default is ".").
+        league_workers (int, optional): Leagues processed concurrently (default is 4). Requests
+            are still bounded by the client's session pool and rate limiter.
+        incremental (bool, optional): Sync transactions incrementally, with one store per league
+            (trade_sync_<name>.json in output_dir).
+
+    Returns:
+        Dict[str, Dict[str, Any]]: League name to {"output", "trades", "seconds"} or {"error", "seconds"}.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    def run(league: Dict[str, Any]) -> Dict[str, Any]:
+        name = league["name"]
+        league_id = league["current_league_id"]
+        output = os.path.join(output_dir, f"trades_{name}.json")
+        sync_store = TradeSyncStore(os.path.join(output_dir, f"trade_sync_{name}.json")) if incremental else None
+        start = time.perf_counter()
+        try:
+            trades = build_trades(api, league, "", output, history_path=f"league_history_{league_id}.json",
+                                  sync_store=sync_store, values=values,
+                                  unmatched_path=os.path.join(output_dir, f"unmatched_{name}.json"),
+                                  resolved_path=os.path.join(output_dir, f"resolved_{name}.json"),
+                                  summary_path=os.path.join(output_dir, f"summary_{name}.json"))
+        except Exception as e:
+            print(f"[{name}] failed: {e}")
+            return {"error": str(e), "seconds": time.perf_counter() - start}
+        print(f"[{name}] {len(trades)} trades written to {output}")
+        return {"output": output, "trades": len(trades), "seconds": time.perf_counter() - start}
+
+    with ThreadPoolExecutor(max_workers=max(1, league_workers)) as executor:
+        results = list(executor.map(run, leagues))
+    return {league["name"]: result for league, result in zip(leagues, results)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build trades JSON for many leagues with one shared client.')
+    parser.add_argument('leagues', nargs='*', help=f'League names ({", ".join(sorted(LEAGUES))}) or league IDs')
+    parser.add_argument('--config', help='JSON list of league configs, each {"name", "current_league_id", optional "drafts"}')
+    parser.add_argument('--output-dir', default='.', help='Directory for trades_<name>.json files (default: .)')
+    parser.add_argument('--league-workers', type=int, default=DEFAULT_LEAGUE_WORKERS, help=f'Leagues processed concurrently (default: {DEFAULT_LEAGUE_WORKERS})')
+    parser.add_argument('--ktc', default=None, help='KTC values CSV (default: ktc_scraper/ktc.csv, then ktc.csv)')
+    parser.add_argument('--cache', default='sleeper_cache.sqlite', help='Path to the HTTP response cache (default: sleeper_cache.sqlite)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore cached responses and refetch everything')
+    parser.add_argument('--incremental', action='store_true', help='Only fetch transactions newer than the last sync of each league')
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS, help=f'Concurrent Sleeper requests (default: {DEFAULT_MAX_WORKERS})')
+    parser.add_argument('--rpm', type=float, default=DEFAULT_REQUESTS_PER_MINUTE, help=f'Sleeper requests per minute budget (default: {DEFAULT_REQUESTS_PER_MINUTE})')
+    parser.add_argument('--replay', metavar='DIR', help='Serve Sleeper responses from this fixture directory instead of the network (the response cache is not used)')
+    parser.add_argument('--base-url', default=BASE, help=f'Sleeper API base URL; the response cache is only used for the default (default: {BASE})')
+    parser.add_argument('--metrics-json', help='Also write per-endpoint request metrics to this JSON file')
+    args = parser.parse_args()
+
+    try:
+        leagues = resolve_leagues(args.leagues, args.config)
+    except ValueError as e:
+        parser.error(str(e))
+    if not leagues:
+        parser.error("no leagues given")
+
+    transport = (lambda: ReplayAdapter(FixtureStore(args.replay))) if args.replay else None
+    # fixtures and stand-in servers must neither be shadowed by nor leak into the live response cache
+    offline = bool(args.replay) or args.base_url != BASE
+    cache = None if offline else ResponseCache(args.cache, bypass=args.no_cache)
+    api = SleeperAPI(cache=cache, max_workers=args.max_workers,
+                     requests_per_minute=args.rpm, warm_players=True, base_url=args.base_url, transport=transport)
+    ktc_path = args.ktc or default_ktc_path()
+    values = load_values(api, ktc_path)
+
+    start = time.perf_counter()
+    results = run_batch(api, leagues, values, args.output_dir, args.league_workers, args.incremental)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'league':<24} {'trades':>7} {'seconds':>9}")
+    for name, result in results.items():
+        trades = result.get("trades", "FAILED")
+        print(f"{name:<24} {trades:>7} {result['seconds']:>9.2f}")
+    print(f"{len(results)} leagues in {elapsed:.2f}s")
+    print(api.metrics.report())
+    if args.metrics_json:
+        api.metrics.dump(args.metrics_json)
+    api.close()
+    if any("error" in result for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
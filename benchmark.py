@@ -0,0 +1,336 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import sleeper_codec
+from dankest import build_trades
+from rate_limiter import RetryPolicy
+from sleeper_api_wrapper import DEFAULT_MAX_WORKERS, SleeperAPI
+from sleeper_metrics import StageTimings
+from sleeper_replay import BASE_PATH, FaultInjector, FixtureStore, ReplayAdapter, make_server
+
+# End-to-end benchmark of the dankest.py trade history build (league history walk, transaction
+# collection, trade resolution, KTC enrichment and the JSON write) against synthetic leagues or
+# recorded fixtures, served offline through sleeper_replay. Each run happens in a fresh
+# subprocess so peak RSS is per run, and results are compared against stored baselines.
+#
+#   python benchmark.py                               # medium preset, compare to baselines
+#   python benchmark.py --preset small --preset large --repeat 5
+#   python benchmark.py --seasons 6 --trades 120 --picks 3 --latency 30
+#   python benchmark.py --fixtures fixtures --league-id 1204869865995771904 --ktc ktc_scraper/ktc.csv
+#   python benchmark.py --update-baseline
+#
+# benchmark_baselines.json holds the committed baselines of the three presets (repeat 3). HTTP
+# call counts are exact on any machine; times and RSS are only comparable on similar hardware,
+# so on a different machine (or CI runner) refresh them with
+#   python benchmark.py --preset small --preset medium --preset large --repeat 3 --update-baseline
+# before relying on the timing checks.
+
+# committed baselines for the presets, next to this file so any working directory finds them
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baselines.json")
+
+# name -> (seasons, trades per season, picks per trade)
+PRESETS: Dict[str, Tuple[int, int, int]] = {
+    "small": (2, 20, 1),
+    "medium": (4, 60, 2),
+    "large": (8, 150, 3),
+}
+
+TEAMS = 12
+DRAFT_ROUNDS = 4
+WEEKS = 17
+LAST_SEASON = 2025
+_ROUND_NAMES = {1: "1st", 2: "2nd", 3: "3rd", 4: "4th"}
+
+
+def make_synthetic_league(directory: str, seasons: int, trades_per_season: int, picks_per_trade: int,
+                          players: int = 3000, seed: int = 0) -> str:
+    """
+    Write fixtures for a synthetic dynasty league, plus a matching ktc.csv, into directory.
+
+    Every season has its own league (chained by previous_league_id, all complete except the
+    newest), a rookie draft and trades spread over the regular season weeks, mixed with waiver
+    noise. Traded picks span the current and next three seasons, so some resolve to drafted
+    players and some stay future picks.
+
+    Returns:
+        str: The current (newest) league ID.
+    """
+    rng = random.Random(seed)
+    store = FixtureStore(directory)
+
+    def save(path: str, payload: Any) -> None:
+        store.save(path, sleeper_codec.dumps(payload))
+
+    player_ids = [str(1000 + i) for i in range(players)]
+    save("/players/nfl", {pid: {"player_id": pid, "full_name": f"Player {pid}", "first_name": "Player",
+                                "last_name": pid, "position": rng.choice(("QB", "RB", "WR", "TE")),
+                                "team": rng.choice(("BUF", "KC", "PHI", "SF", "DAL", "DET")), "active": True}
+                          for pid in player_ids})
+    save("/state/nfl", {"season": str(LAST_SEASON), "week": 10, "leg": 10, "season_type": "regular"})
+
+    users = [{"user_id": str(500 + team), "display_name": f"Team {team}", "avatar": None,
+              "metadata": {"team_name": f"Team {team}"}} for team in range(1, TEAMS + 1)]
+    first_season = LAST_SEASON - seasons + 1
+    previous_league_id = None
+    league_id = ""
+    transaction_id = 0
+    for season in range(first_season, LAST_SEASON + 1):
+        league_id = str(900000 + season)
+        draft_id = str(800000 + season)
+        save(f"/league/{league_id}", {
+            "league_id": league_id, "name": "Benchmark League", "season": str(season),
+            "status": "in_season" if season == LAST_SEASON else "complete", "total_rosters": TEAMS,
+            "previous_league_id": previous_league_id, "draft_id": draft_id, "settings": {"draft_rounds": DRAFT_ROUNDS},
+        })
+        save(f"/league/{league_id}/users", users)
+        save(f"/league/{league_id}/rosters", [
+            {"roster_id": team, "owner_id": str(500 + team), "players": rng.sample(player_ids, 25), "settings": {}}
+            for team in range(1, TEAMS + 1)])
+
+        slots = list(range(1, TEAMS + 1))
+        rng.shuffle(slots)
+        slot_to_roster_id = {str(slot): roster_id for roster_id, slot in enumerate(slots, 1)}
+        draft = {"draft_id": draft_id, "season": str(season), "status": "complete", "type": "linear",
+                 "league_id": league_id, "slot_to_roster_id": slot_to_roster_id}
+        save(f"/league/{league_id}/drafts", [draft])
+        save(f"/draft/{draft_id}", draft)
+        rookies = rng.sample(player_ids, DRAFT_ROUNDS * TEAMS)
+        save(f"/draft/{draft_id}/picks", [
+            {"round": rnd, "draft_slot": slot, "pick_no": (rnd - 1) * TEAMS + slot, "player_id": rookies.pop(),
+             "roster_id": slot_to_roster_id[str(slot)], "picked_by": "", "metadata": {}}
+            for rnd in range(1, DRAFT_ROUNDS + 1) for slot in range(1, TEAMS + 1)])
+
+        weeks: Dict[int, List[Dict[str, Any]]] = {week: [] for week in range(1, WEEKS + 1)}
+        for _ in range(trades_per_season):
+            transaction_id += 1
+            a, b = rng.sample(range(1, TEAMS + 1), 2)
+            to_a, to_b = rng.sample(player_ids, 2)
+            picks = []
+            for _ in range(picks_per_trade):
+                owner, giver = (a, b) if rng.random() < 0.5 else (b, a)
+                picks.append({"season": str(season + rng.randint(0, 3)), "round": rng.randint(1, DRAFT_ROUNDS),
+                              "roster_id": rng.randint(1, TEAMS), "owner_id": owner, "previous_owner_id": giver})
+            week = rng.randint(1, WEEKS)
+            weeks[week].append({
+                "transaction_id": str(10 ** 9 + transaction_id), "type": "trade", "status": "complete",
+                "created": int(time.mktime((season, 9, 1, 0, 0, 0, 0, 0, -1)) * 1000) + week * 7 * 86400000,
+                "leg": week, "roster_ids": [a, b], "adds": {to_a: a, to_b: b}, "drops": {to_a: b, to_b: a},
+                "draft_picks": picks,
+            })
+            # waiver noise the trade filter has to skip
+            for _ in range(2):
+                transaction_id += 1
+                weeks[rng.randint(1, WEEKS)].append({
+                    "transaction_id": str(10 ** 9 + transaction_id), "type": "waiver", "status": "complete",
+                    "roster_ids": [a], "adds": {rng.choice(player_ids): a}, "drops": None, "draft_picks": []})
+        for week, transactions in weeks.items():
+            save(f"/league/{league_id}/transactions/{week}", transactions)
+        previous_league_id = league_id
+
+    # KTC values for most players, and mid-round values for every pick season in play
+    with open(os.path.join(directory, "ktc.csv"), "w", encoding="utf-8", newline="") as f:
+        f.write("Updated 01/01/26 at 12:00pm,Position Rank,Position,Team,Value\n")
+        for pid in player_ids:
+            if rng.random() < 0.9:
+                f.write(f"Player {pid},WR1,WR,BUF,{rng.randint(100, 9999)}\n")
+        for season in range(first_season, LAST_SEASON + 4):
+            for rnd in range(1, DRAFT_ROUNDS + 1):
+                f.write(f"{season} Mid {_ROUND_NAMES[rnd]},,PICK,,{rng.randint(100, 7000)}\n")
+    return league_id
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_once(fixtures: str, league_id: str, ktc_path: str, max_workers: int = DEFAULT_MAX_WORKERS,
+             latency: float = 0.0, error_rate: float = 0.0, server: bool = False, seed: int = 0) -> Dict[str, Any]:
+    """
+    Run the dankest.py build once against fixtures, cold (no response cache, no saved history,
+    no players file) and unthrottled, and measure it. Meant to run in a fresh process.
+
+    Returns:
+        Dict[str, Any]: wall_s, http_calls, retries, peak_rss_mb, trades and stages (seconds per stage).
+    """
+    store = FixtureStore(fixtures)
+    faults = FaultInjector(latency, error_rate=error_rate, seed=seed) if latency or error_rate else None
+    http_server = None
+    if server:
+        http_server = make_server(store, faults=faults)
+        threading.Thread(target=http_server.serve_forever, daemon=True).start()
+        options = {"base_url": f"http://127.0.0.1:{http_server.server_address[1]}{BASE_PATH}"}
+    else:
+        options = {"transport": lambda: ReplayAdapter(store, faults)}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        timings = StageTimings()
+        start = time.perf_counter()
+        api = SleeperAPI(players_cache_path=os.path.join(workdir, "players.json"), player_index_path=None,
+                         max_workers=max_workers, requests_per_minute=None,
+                         retry=RetryPolicy(base_delay=0.01), warm_players=True, **options)
+        # dankest prints progress and a warning per unvalued player
+        with contextlib.redirect_stdout(io.StringIO()):
+            trades = build_trades(api, {"current_league_id": league_id}, ktc_path,
+                                  os.path.join(workdir, "trades.json"), timings=timings,
+                                  crosswalk_path=os.path.join(workdir, "ktc_crosswalk.json"))
+        wall = time.perf_counter() - start
+        totals = api.metrics.totals()
+        api.close()
+    if http_server is not None:
+        http_server.shutdown()
+    return {"wall_s": round(wall, 4), "http_calls": totals["calls"], "retries": totals["retries"],
+            "peak_rss_mb": peak_rss_mb(), "trades": len(trades),
+            "stages": {name: round(seconds, 4) for name, seconds in timings.stages.items()}}
+
+
+def run_scenario(fixtures: str, league_id: str, ktc_path: str, repeat: int, args: argparse.Namespace) -> Dict[str, Any]:
+    # each repeat in its own interpreter, so imports and peak RSS start from scratch
+    runs = []
+    for _ in range(repeat):
+        command = [sys.executable, os.path.abspath(__file__), "--worker", fixtures, "--league-id", league_id,
+                   "--ktc", ktc_path, "--max-workers", str(args.max_workers), "--latency", str(args.latency),
+                   "--error-rate", str(args.error_rate), "--seed", str(args.seed)]
+        if args.server:
+            command.append("--server")
+        output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    # medians over the repeats; call counts are deterministic without injected errors
+    stages = {name: round(statistics.median(run["stages"][name] for run in runs), 4) for name in runs[0]["stages"]}
+    return {
+        "wall_s": round(statistics.median(run["wall_s"] for run in runs), 4),
+        "http_calls": max(run["http_calls"] for run in runs),
+        "peak_rss_mb": max(run["peak_rss_mb"] for run in runs),
+        "trades": runs[0]["trades"],
+        "stages": stages,
+        "repeat": repeat,
+    }
+
+
+def compare(name: str, result: Dict[str, Any], baseline: Optional[Dict[str, Any]], tolerance: float) -> List[str]:
+    """
+    Get the regressions of a result against its baseline: wall time, any stage, or peak RSS more
+    than tolerance slower/larger, or more HTTP calls than before.
+    """
+    if baseline is None:
+        return []
+    regressions = []
+    limit = 1 + tolerance
+    if result["wall_s"] > baseline["wall_s"] * limit:
+        regressions.append(f"{name}: wall {result['wall_s']:.3f}s vs baseline {baseline['wall_s']:.3f}s")
+    if result["http_calls"] > baseline["http_calls"]:
+        regressions.append(f"{name}: {result['http_calls']} HTTP calls vs baseline {baseline['http_calls']}")
+    if result["peak_rss_mb"] > baseline["peak_rss_mb"] * limit:
+        regressions.append(f"{name}: peak RSS {result['peak_rss_mb']} MB vs baseline {baseline['peak_rss_mb']} MB")
+    for stage, seconds in result["stages"].items():
+        before = baseline.get("stages", {}).get(stage)
+        # ignore stages too short to time reliably
+        if before is not None and seconds > 0.05 and seconds > before * limit:
+            regressions.append(f"{name}: stage {stage} {seconds:.3f}s vs baseline {before:.3f}s")
+    return regressions
+
+
+def format_result(name: str, result: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> str:
+    def delta(key: str) -> str:
+        if baseline is None or not baseline.get(key):
+            return ""
+        return f" ({(result[key] / baseline[key] - 1) * 100:+.0f}%)"
+
+    lines = [f"{name}: {result['trades']} trades",
+             f"  wall         {result['wall_s']:>9.3f} s{delta('wall_s')}",
+             f"  http         {result['http_calls']:>9} calls{delta('http_calls')}",
+             f"  peak rss     {result['peak_rss_mb']:>9.1f} MB{delta('peak_rss_mb')}"]
+    for stage, seconds in result["stages"].items():
+        lines.append(f"  {stage:<12} {seconds:>9.3f} s")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the dankest.py trade history build offline.')
+    parser.add_argument('--preset', action='append', choices=sorted(PRESETS), help='Synthetic league size; repeatable (default: medium)')
+    parser.add_argument('--seasons', type=int, help='Custom synthetic league: number of seasons')
+    parser.add_argument('--trades', type=int, default=60, help='Custom synthetic league: trades per season (default: 60)')
+    parser.add_argument('--picks', type=int, default=2, help='Custom synthetic league: picks per trade (default: 2)')
+    parser.add_argument('--fixtures', help='Benchmark a recorded league (dankest.py --record DIR) instead of a synthetic one')
+    parser.add_argument('--league-id', help='Current league ID of the recorded league')
+    parser.add_argument('--ktc', help='KTC values CSV for a recorded league')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per scenario; medians are reported (default: 3)')
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS, help=f'Concurrent requests (default: {DEFAULT_MAX_WORKERS})')
+    parser.add_argument('--latency', type=float, default=0.0, help='Injected latency per request in milliseconds (default: 0)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 429/503 (default: 0)')
+    parser.add_argument('--server', action='store_true', help='Go through a local HTTP stand-in server instead of the in-process replay adapter')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic league and injected faults (default: 0)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH, help='Baseline file (default: benchmark_baselines.json next to this script)')
+    parser.add_argument('--update-baseline', action='store_true', help='Store these results as the new baselines')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown/growth before a regression is reported (default: 0.25)')
+    parser.add_argument('--json', help='Also write the results to this JSON file')
+    parser.add_argument('--worker', metavar='FIXTURES', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        result = run_once(args.worker, args.league_id, args.ktc, args.max_workers, args.latency / 1000,
+                          args.error_rate, args.server, args.seed)
+        print(json.dumps(result))
+        return
+
+    # the conditions a run was measured under are part of the scenario name, so baselines only
+    # compare like with like
+    suffix = f"-lat{args.latency:g}ms" if args.latency else ""
+    suffix += f"-err{args.error_rate:g}" if args.error_rate else ""
+    suffix += "-server" if args.server else ""
+
+    results = {}
+    if args.fixtures:
+        if not args.league_id or not args.ktc:
+            parser.error("--fixtures needs --league-id and --ktc")
+        results[f"recorded-{args.league_id}{suffix}"] = run_scenario(args.fixtures, args.league_id, args.ktc, args.repeat, args)
+    else:
+        scenarios = {}
+        if args.seasons:
+            scenarios[f"s{args.seasons}-t{args.trades}-p{args.picks}"] = (args.seasons, args.trades, args.picks)
+        for preset in args.preset or ([] if args.seasons else ["medium"]):
+            scenarios[preset] = PRESETS[preset]
+        for name, (seasons, trades, picks) in scenarios.items():
+            with tempfile.TemporaryDirectory() as fixtures:
+                print(f"Generating {name}: {seasons} seasons, {trades} trades/season, {picks} picks/trade...")
+                league_id = make_synthetic_league(fixtures, seasons, trades, picks, seed=args.seed)
+                results[name + suffix] = run_scenario(fixtures, league_id, os.path.join(fixtures, "ktc.csv"), args.repeat, args)
+
+    baselines = {}
+    if os.path.exists(args.baseline):
+        baselines = sleeper_codec.load(args.baseline)
+    regressions = []
+    for name, result in results.items():
+        print(format_result(name, result, baselines.get(name)))
+        regressions += compare(name, result, baselines.get(name), args.tolerance)
+    if args.json:
+        sleeper_codec.dump(results, args.json)
+
+    if args.update_baseline:
+        baselines.update(results)
+        sleeper_codec.dump(baselines, args.baseline)
+        print(f"Baselines updated in {args.baseline}")
+    elif regressions:
+        print("REGRESSIONS:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    elif any(name not in baselines for name in results):
+        print(f"No baseline for some scenarios; run with --update-baseline to store them in {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
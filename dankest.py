@@ -1,11 +1,25 @@
-import json
-import csv
-import re
+import argparse
+import hashlib
 import os
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Sequence
 
-from sleeper_api_wrapper import SleeperAPI
+import sleeper_codec
+from generate_data_js import write_data_js
+from pipeline import Pipeline, PipelineError, Stage, file_hash
+from rate_limiter import DEFAULT_REQUESTS_PER_MINUTE
+from sleeper_api_wrapper import BASE, DEFAULT_MAX_WORKERS, SleeperAPI
+from sleeper_cache import ResponseCache
+from sleeper_metrics import StageTimings
+from sleeper_replay import FixtureStore, RecordingAdapter, ReplayAdapter
+from trade_analytics import summarize_trades
+from trade_sync import TradeSyncStore, sync_trades
+from value_index import DEFAULT_CROSSWALK_PATH, ValueIndex
 
+if TYPE_CHECKING:
+    from ktc_snapshots import SnapshotStore
+
+# drafts per season come from the cached league history, overlaid with these pins; a season
+# with several (or recreated) drafts must be pinned, as the history just takes the first one
 DANKEST = {"current_league_id": "1182986456149786624",
            "drafts": {'2025': '1182986456149786625',
                       '2024': '1080545431282696193',
@@ -16,174 +30,332 @@ CHICKS = {"current_league_id": "1204869865995771904",
                      '2023': '918476323692089345',
                      '2022': '789660475934760961',
                      '2021': '709955959941840896'}}
+# known leagues by name, for --league here and in batch_trades.py
+LEAGUES = {"dankest": DANKEST, "chicks": CHICKS}
 
 
-def list_all_trades(api: SleeperAPI, league_ids: List[str]) -> Dict[str, Any]:
+def list_all_trades(api: SleeperAPI, league_ids: List[str], max_workers: int = None) -> Dict[str, Any]:
     all_trades = {}
+    transactions = api.collect_transactions(league_ids, range(1, 18), max_workers=max_workers)
     for league_id in league_ids:
-        for week in range(1, 18):
-            trades = api.get_league_transactions(league_id, week=week)  # week=0 to get all transactions
-            trade_list = [trade for trade in trades if trade['type'] == 'trade']
-            if league_id in all_trades:
-                all_trades[league_id].extend(trade_list)
-            else:
-                all_trades[league_id] = trade_list
+        all_trades[league_id] = [trade for trade in transactions[league_id] if trade['type'] == 'trade']
     return all_trades
 
 
-def normalize_name(name):
-    """Removes suffixes like Jr., III, etc. and lowercases for comparison."""
-    if not name:
-        return ""
-    # Remove common suffixes
-    name = re.sub(r'\s+(Jr\.?|Sr\.?|III|II|IV|V)(\s|$)', '', name, flags=re.IGNORECASE)
-    # Remove special characters and extra spaces
-    name = re.sub(r'[^\w\s]', '', name)
-    return name.strip().lower()
-
-
-def load_ktc_values(csv_path):
-    ktc_values = {}
-    if not os.path.exists(csv_path):
-        print(f"Warning: KTC CSV not found at {csv_path}")
-        return ktc_values
-
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Player value
-            name = row.get('Player', row.get('Name', '')) # Adjust based on actual CSV header
-            # Based on view_file, the header is "Updated...", "Position Rank", "Position", "Team", "Value", ...
-            # Wait, the first column seems to be the name but has a weird header "Updated 12/07/25..."
-            # Let's look at the file content again.
-            # Line 1: Updated 12/07/25 at 01:20pm,Position Rank,Position,Team,Value,...
-            # Line 2: Josh Allen,QB1,QB,BUF,9986,...
-            # So the first column is the Name, but the header is "Updated...".
-            # We can access it by index or by the weird header name.
-            
-            # Let's try to get the first key from the row
-            keys = list(row.keys())
-            if not keys:
-                continue
-            name = row[keys[0]]
-            
-            value_str = row.get('Value', '0')
-            try:
-                value = int(value_str)
-            except ValueError:
-                value = 0
-            
-            ktc_values[normalize_name(name)] = value
-            
-            # Store raw name too just in case
-            ktc_values[name.lower()] = value
-            
-    return ktc_values
-
-
-def get_pick_value(season, round_num, ktc_values):
-    # Format: "2025 Mid 1st", "2025 Mid 2nd", etc.
-    # User said: "If it is a pick (with no player) find the value of a mid pick in that round."
-    
-    suffix = "th"
-    if round_num == 1: suffix = "st"
-    elif round_num == 2: suffix = "nd"
-    elif round_num == 3: suffix = "rd"
-    
-    query = f"{season} Mid {round_num}{suffix}"
-    
-    # Try to find it in KTC values
-    # KTC format in CSV: "2027 Early 1st", "2026 Mid 1st", etc.
-    # We need to match "Mid".
-    
-    # Let's construct the key
-    key = normalize_name(query)
-    if key in ktc_values:
-        return ktc_values[key]
-        
-    # Fallback: Try "Early" or "Late" if Mid not found? 
-    # Or maybe the year is too far out.
-    # KTC usually has current + 3 years.
-    
-    return 0
-
-
-def enrich_trades(trade_infos, ktc_values):
+def enrich_trades(trade_infos, values: ValueIndex, unmatched: Optional[Dict[str, str]] = None):
+    """
+    Set a "value" on every traded asset: players (including drafted picks) by player_id, future
+    picks by season and round. Players without a KTC value get 0 and are added to unmatched
+    (player_id -> name) if given.
+    """
     for trade in trade_infos:
         for team, sides in trade.items():
             if team == 'time_created': continue
-            
-            # Process additions
-            for asset in sides.get('additions', []):
-                asset['value'] = 0
-                if 'name' in asset and asset['name']:
-                    # Player
-                    norm_name = normalize_name(asset['name'])
-                    if norm_name in ktc_values:
-                        asset['value'] = ktc_values[norm_name]
-                    else:
-                        # Try exact match lower
-                        if asset['name'].lower() in ktc_values:
-                            asset['value'] = ktc_values[asset['name'].lower()]
-                    if asset['value'] == 0:
-                        print("Warning: Could not find value for player:", asset['name'])
-                else:
-                    # Pick
-                    if 'season' in asset and 'round' in asset:
-                        asset['value'] = get_pick_value(asset['season'], asset['round'], ktc_values)
 
-            # Process subtractions
-            for asset in sides.get('subtractions', []):
-                asset['value'] = 0
-                if 'name' in asset and asset['name']:
+            for asset in sides.get('additions', []) + sides.get('subtractions', []):
+                if asset.get('id'):
                     # Player
-                    norm_name = normalize_name(asset['name'])
-                    if norm_name in ktc_values:
-                        asset['value'] = ktc_values[norm_name]
-                    else:
-                        if asset['name'].lower() in ktc_values:
-                            asset['value'] = ktc_values[asset['name'].lower()]
-                else:
+                    value = values.player_value(asset['id'])
+                    if value is None and unmatched is not None:
+                        unmatched[asset['id']] = asset.get('name')
+                    asset['value'] = value or 0
+                elif 'season' in asset and 'round' in asset:
                     # Pick
-                    if 'season' in asset and 'round' in asset:
-                        asset['value'] = get_pick_value(asset['season'], asset['round'], ktc_values)
+                    asset['value'] = values.pick_value(asset['season'], asset['round'])
+                else:
+                    asset['value'] = 0
     return trade_infos
 
 
-def main():
-    api = SleeperAPI()
-    league = CHICKS
-    league_id = league["current_league_id"]
-    drafts = league["drafts"]
-    
-    # Load KTC Values
+def default_ktc_path() -> str:
     # Assuming ktc.csv is in ktc_scraper/ktc.csv based on previous find
     ktc_path = os.path.join('ktc_scraper', 'ktc.csv')
     if not os.path.exists(ktc_path):
         ktc_path = 'ktc.csv' # Fallback
-        
+    return ktc_path
+
+
+def load_values(api: SleeperAPI, ktc_path: str, crosswalk_path: Optional[str] = DEFAULT_CROSSWALK_PATH,
+                trust_crosswalk: bool = False, offline: bool = False) -> ValueIndex:
+    """
+    Build the KTC value index for a CSV, matching KTC names to Sleeper players through the crosswalk.
+    With trust_crosswalk the players table is only read if the CSV has names the crosswalk lacks.
+    offline implies trust_crosswalk and leaves such names unresolved, so nothing is fetched from Sleeper.
+    """
     print(f"Loading KTC values from {ktc_path}...")
-    ktc_values = load_ktc_values(ktc_path)
-    print(f"Loaded {len(ktc_values)} values.")
-
-    all_league_ids = api.get_all_previous_league_ids(league_id)
-    all_trades = list_all_trades(api, list(all_league_ids.values()))
-
-    trade_infos = []
-    for trade in all_trades.values():
-        for t in trade:
-            trade_infos.append(api.get_trade_info(t, league_id, drafts))
-            
-    # Enrich with values
+    values = ValueIndex.from_csv(ktc_path, api.player_records(), crosswalk_path, trust_crosswalk or offline,
+                                 match_new=not offline)
+    print(f"Loaded {len(values.player_values)} player and {len(values.pick_values)} pick values "
+          f"({len(values.unresolved)} KTC names not matched to a Sleeper player).")
+    return values
+
+
+def trade_stages(api: SleeperAPI, league: Dict[str, Any], ktc_path: str, output_path: str = "trades.json",
+                 history_path: Optional[str] = None, sync_store: Optional[TradeSyncStore] = None,
+                 values: Optional[ValueIndex] = None, crosswalk_path: Optional[str] = DEFAULT_CROSSWALK_PATH,
+                 unmatched_path: Optional[str] = None, snapshots: Optional["SnapshotStore"] = None,
+                 resolved_path: Optional[str] = None, data_js_path: Optional[str] = None,
+                 summary_path: Optional[str] = None) -> List[Stage]:
+    """
+    The trade history build as pipeline stages: history, transactions, ktc, resolve, enrich,
+    write and summary. See build_trades for the arguments.
+
+    history, transactions and resolve read the Sleeper API (resolve for rosters, users, drafts
+    and player names) and run every time, through the response cache; the rest are skipped when
+    their inputs hash the same as last time.
+    """
+    league_id = league["current_league_id"]
+
+    def history(inputs):
+        history = api.get_league_history(league_id, history_path)
+        return {"league_ids": history.league_ids(),
+                "drafts": {**history.draft_ids_by_season(), **league.get("drafts", {})}}
+
+    def transactions(inputs):
+        league_ids = list(inputs["history"]["league_ids"].values())
+        if sync_store is not None:
+            all_trades = sync_trades(api, sync_store, league_ids)
+        else:
+            all_trades = list_all_trades(api, league_ids)
+        return [t for trades in all_trades.values() for t in trades]
+
+    def ktc(inputs):
+        if snapshots is not None:
+            # stands in for the store, so a changed store changes this output and reruns enrich
+            return {"snapshots": file_hash(snapshots.path)}
+        if values is not None:
+            return {"values": values.to_dict()}
+        # the crosswalk is hashed after the build, which may rewrite it (see crosswalk_unchanged)
+        return {"values": load_values(api, ktc_path, crosswalk_path).to_dict(), "crosswalk": file_hash(crosswalk_path)}
+
+    def resolve(inputs):
+        trade_infos = api.resolve_trades(inputs["transactions"], league_id, inputs["history"]["drafts"])
+        if resolved_path:
+            # before enrich_trades, which adds values in place
+            sleeper_codec.dump(trade_infos, resolved_path, indent=False)
+        return trade_infos
+
+    def enrich(inputs):
+        index = ValueIndex.from_dict(inputs["ktc"]["values"]) if snapshots is None else None
+        return value_trades(inputs["resolve"], index, snapshots, unmatched_path)
+
+    def write(inputs):
+        return write_trades(inputs["enrich"], output_path, data_js_path)
+
+    def summary(inputs):
+        return write_summary(inputs["enrich"], summary_path)
+
+    def ktc_inputs():
+        if snapshots is not None:
+            return {"snapshots": file_hash(snapshots.path)}
+        if values is not None:
+            return {"values": hashlib.sha256(sleeper_codec.dumps(values.to_dict())).hexdigest()}
+        return {"ktc": file_hash(ktc_path)}
+
+    def crosswalk_unchanged(output):
+        # a hand-edited crosswalk rebuilds the values; the stage's own rewrites do not count
+        return "crosswalk" not in output or output["crosswalk"] == file_hash(crosswalk_path)
+
+    def written(output):
+        return all(file_hash(path) == content_hash for path, content_hash in output["files"].items())
+
+    return [
+        Stage("history", history, fingerprint=lambda: [league_id, league.get("drafts")], volatile=True),
+        Stage("transactions", transactions, ["history"], fingerprint=lambda: sync_store is not None, volatile=True),
+        Stage("ktc", ktc, fingerprint=ktc_inputs, valid=crosswalk_unchanged),
+        # volatile: a finished draft or a renamed team changes the result without a new transaction
+        Stage("resolve", resolve, ["history", "transactions"], fingerprint=lambda: resolved_path, volatile=True,
+              valid=lambda output: not resolved_path or os.path.exists(resolved_path)),
+        Stage("enrich", enrich, ["resolve", "ktc"], fingerprint=lambda: unmatched_path),
+        Stage("write", write, ["enrich"], fingerprint=lambda: [output_path, data_js_path], valid=written),
+        Stage("summary", summary, ["enrich"], fingerprint=lambda: summary_path, valid=written),
+    ]
+
+
+def build_trades(api: SleeperAPI, league: Dict[str, Any], ktc_path: str, output_path: str = "trades.json",
+                 history_path: Optional[str] = None, sync_store: Optional[TradeSyncStore] = None,
+                 timings: Optional[StageTimings] = None, values: Optional[ValueIndex] = None,
+                 crosswalk_path: Optional[str] = DEFAULT_CROSSWALK_PATH,
+                 unmatched_path: Optional[str] = None, snapshots: Optional["SnapshotStore"] = None,
+                 resolved_path: Optional[str] = None, data_js_path: Optional[str] = None,
+                 summary_path: Optional[str] = None, checkpoint_dir: Optional[str] = None, only: Optional[List[str]] = None,
+                 force: Sequence[str] = (), resume: bool = False) -> List[Dict[str, Any]]:
+    """
+    Build the valued trade history of a league and write it to output_path.
+
+    Args:
+        api (SleeperAPI): The client to fetch through.
+        league (Dict[str, Any]): League config, e.g. CHICKS.
+        ktc_path (str): KTC values CSV.
+        output_path (str, optional): Where to write the trades JSON (default is "trades.json").
+        history_path (str, optional): File to persist the league history in (see LeagueHistory).
+        sync_store (TradeSyncStore, optional): Only fetch transactions newer than the last sync.
+        timings (StageTimings, optional): Collects wall time per stage that ran (see trade_stages).
+        values (ValueIndex, optional): Already built KTC values, e.g. shared by several leagues;
+            ktc_path is not read when given.
+        crosswalk_path (str, optional): KTC name to player_id crosswalk used when building values.
+        unmatched_path (str, optional): Write traded players that have no KTC value to this JSON file.
+        snapshots (SnapshotStore, optional): Value each trade as of its time_created from these
+            historical snapshots (see ktc_snapshots.py) instead of at today's KTC values.
+        resolved_path (str, optional): Also save the resolved trades before valuation here, so
+            revalue_trades can apply new values later without calling Sleeper.
+        data_js_path (str, optional): Also write the trades as a data.js file for the docs site.
+        summary_path (str, optional): Also write the per-team summary (see trade_analytics) here.
+        checkpoint_dir (str, optional): Checkpoint stage outputs here and skip stages whose inputs
+            are unchanged (see pipeline.Pipeline); without it every stage runs.
+        only (List[str], optional): Run just these stages, taking the others from checkpoints.
+        force (Sequence[str], optional): Run these stages even if their checkpoints are current.
+        resume (bool, optional): Continue an interrupted run, reusing checkpoints of the Sleeper stages too.
+
+    Returns:
+        List[Dict[str, Any]]: The trades as written.
+    """
+    stages = trade_stages(api, league, ktc_path, output_path, history_path, sync_store, values, crosswalk_path,
+                          unmatched_path, snapshots, resolved_path, data_js_path, summary_path)
+    result = Pipeline(stages, checkpoint_dir).run(only, force, resume, timings)
+    return result.output("enrich")
+
+
+def value_trades(trade_infos: List[Dict[str, Any]], values: Optional[ValueIndex] = None,
+                 snapshots: Optional["SnapshotStore"] = None, unmatched_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Value resolved trades, from today's values or as of each trade with snapshots, and report
+    traded players without a value.
+    """
     print("Enriching trades with values...")
-    trade_infos = enrich_trades(trade_infos, ktc_values)
+    unmatched: Dict[str, str] = {}
+    if snapshots is not None:
+        from ktc_snapshots import enrich_trades_as_of
+        trade_infos = enrich_trades_as_of(trade_infos, snapshots, unmatched)
+    else:
+        trade_infos = enrich_trades(trade_infos, values, unmatched)
+    if unmatched:
+        print(f"Warning: {len(unmatched)} traded players have no KTC value"
+              + (f", see {unmatched_path}" if unmatched_path else ""))
+    if unmatched_path:
+        unresolved = values.unresolved if values is not None else []
+        sleeper_codec.dump({"players": unmatched, "unresolved_ktc_names": unresolved}, unmatched_path)
+    return trade_infos
+
+
+def write_trades(trade_infos: List[Dict[str, Any]], output_path: str, data_js_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Write the trades JSON (and data.js). Returns {"files": {path: sha256}} of what was written.
+    """
+    sleeper_codec.dump(trade_infos, output_path)
+    paths = [output_path]
+    if data_js_path:
+        write_data_js(trade_infos, data_js_path)
+        paths.append(data_js_path)
+    return {"files": {path: file_hash(path) for path in paths}}
+
+
+def write_summary(trade_infos: List[Dict[str, Any]], summary_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Write the per-team summary of the trades (see trade_analytics). Returns {"files": {path: sha256}}.
+    """
+    if not summary_path:
+        return {"files": {}}
+    sleeper_codec.dump(summarize_trades(trade_infos), summary_path)
+    return {"files": {summary_path: file_hash(summary_path)}}
+
+
+def revalue_trades(resolved_path: str, output_path: str = "trades.json", values: Optional[ValueIndex] = None,
+                   snapshots: Optional["SnapshotStore"] = None, unmatched_path: Optional[str] = None,
+                   data_js_path: Optional[str] = None, timings: Optional[StageTimings] = None,
+                   summary_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Re-value trades saved by build_trades(resolved_path=...) with new values, without any Sleeper calls.
+
+    Example:
+        >>> revalue_trades("trades_resolved.json", "trades.json", load_values(api, "ktc_scraper/ktc.csv", offline=True),
+        ...                data_js_path="docs/data.js")
+    """
+    timings = timings if timings is not None else StageTimings()
+    with timings.stage("load"):
+        trade_infos = sleeper_codec.load(resolved_path)
+    with timings.stage("enrich"):
+        trade_infos = value_trades(trade_infos, values, snapshots, unmatched_path)
+    with timings.stage("write"):
+        write_trades(trade_infos, output_path, data_js_path)
+    with timings.stage("summary"):
+        write_summary(trade_infos, summary_path)
+    return trade_infos
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build trades.json from Sleeper trade history.')
+    parser.add_argument('--league', choices=sorted(LEAGUES), default='chicks', help='League to build (default: chicks)')
+    parser.add_argument('--cache', default='sleeper_cache.sqlite', help='Path to the HTTP response cache (default: sleeper_cache.sqlite)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore cached responses and refetch everything')
+    parser.add_argument('--incremental', action='store_true', help='Only fetch transactions newer than the last sync (see trade_sync.py)')
+    parser.add_argument('--sync-store', default='trade_sync.json', help='Path to the incremental sync store (default: trade_sync.json)')
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS, help=f'Concurrent Sleeper requests (default: {DEFAULT_MAX_WORKERS})')
+    parser.add_argument('--rpm', type=float, default=DEFAULT_REQUESTS_PER_MINUTE, help=f'Sleeper requests per minute budget (default: {DEFAULT_REQUESTS_PER_MINUTE})')
+    parser.add_argument('--metrics-json', help='Also write per-endpoint request metrics to this JSON file')
+    parser.add_argument('--as-of', action='store_true', help='Value each trade at the KTC values of its date (see ktc_snapshots.py) instead of today\'s')
+    parser.add_argument('--snapshots', default=None, help='Snapshot store for --as-of (default: ktc_snapshots.npz)')
+    parser.add_argument('--revalue', action='store_true', help='Only re-value the trades saved by the last full run (trades_resolved.json) and write trades.json, trades_summary.json and docs/data.js; no Sleeper calls')
+    parser.add_argument('--resolved', default='trades_resolved.json', help='Resolved (unvalued) trades saved by a full run and read by --revalue (default: trades_resolved.json)')
+    parser.add_argument('--checkpoints', default='.pipeline', help='Stage checkpoint directory; unchanged stages are skipped on reruns (default: .pipeline)')
+    parser.add_argument('--no-checkpoints', action='store_true', help='Run every stage and keep no checkpoints')
+    parser.add_argument('--stages', help='Comma-separated stages to run, taking the others from checkpoints (stages: history, transactions, ktc, resolve, enrich, write, summary)')
+    parser.add_argument('--force', default='', help='Comma-separated stages to run even if their checkpoints are current')
+    parser.add_argument('--resume', action='store_true', help='Continue an interrupted run, reusing checkpointed Sleeper data instead of fetching again')
+    parser.add_argument('--record', metavar='DIR', help='Save every Sleeper response into this fixture directory (implies --no-cache)')
+    parser.add_argument('--replay', metavar='DIR', help='Serve Sleeper responses from this fixture directory instead of the network (the response cache is not used)')
+    parser.add_argument('--base-url', default=BASE, help=f'Sleeper API base URL, e.g. a local sleeper_replay.py server; the response cache is only used for the default (default: {BASE})')
+    args = parser.parse_args()
+
+    transport = None
+    if args.record:
+        transport = lambda: RecordingAdapter(FixtureStore(args.record))
+    elif args.replay:
+        transport = lambda: ReplayAdapter(FixtureStore(args.replay))
+    # fixtures and stand-in servers must neither be shadowed by nor leak into the live response cache
+    offline = bool(args.replay) or args.base_url != BASE
+    cache = None if offline else ResponseCache(args.cache, bypass=args.no_cache or bool(args.record))
+    api = SleeperAPI(cache=cache, max_workers=args.max_workers,
+                     requests_per_minute=args.rpm, warm_players=not args.revalue, base_url=args.base_url, transport=transport)
+    league = LEAGUES[args.league]
+    league_id = league["current_league_id"]
+
+    snapshots = None
+    if args.as_of:
+        # numpy is only needed for point-in-time values
+        from ktc_snapshots import DEFAULT_SNAPSHOT_PATH, SnapshotStore
+        snapshots = SnapshotStore(args.snapshots or DEFAULT_SNAPSHOT_PATH)
+        if not len(snapshots):
+            parser.error(f"no KTC snapshots in {snapshots.path}; add some with ktc_snapshots.py add")
 
-    # save to file
-    with open("trades.json", "w") as f:
-        json.dump(trade_infos, f, indent=2)
-    
+    timings = StageTimings()
+    if args.revalue:
+        if not os.path.exists(args.resolved):
+            parser.error(f"{args.resolved} not found; run once without --revalue first")
+        values = None
+        if snapshots is None:
+            with timings.stage("ktc"):
+                # KTC names new since the last full run stay unresolved rather than fetch /players
+                values = load_values(api, default_ktc_path(), offline=True)
+        revalue_trades(args.resolved, "trades.json", values, snapshots, "unmatched_players.json",
+                       os.path.join("docs", "data.js"), timings, "trades_summary.json")
+    else:
+        try:
+            build_trades(api, league, default_ktc_path(), "trades.json", history_path=f"league_history_{league_id}.json",
+                         unmatched_path="unmatched_players.json", snapshots=snapshots, resolved_path=args.resolved,
+                         summary_path="trades_summary.json",
+                         sync_store=TradeSyncStore(args.sync_store) if args.incremental else None, timings=timings,
+                         checkpoint_dir=None if args.no_checkpoints else os.path.join(args.checkpoints, args.league),
+                         only=args.stages.split(",") if args.stages else None,
+                         force=[name for name in args.force.split(",") if name], resume=args.resume)
+        except PipelineError as e:
+            parser.error(str(e))
 
-    print("Done. trades.json updated.")
+    print("Done. trades.json and trades_summary.json updated.")
+    print(timings.report())
+    print(api.metrics.report())
+    if args.metrics_json:
+        api.metrics.dump(args.metrics_json)
 
 if __name__ == '__main__':
     main()
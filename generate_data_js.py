@@ -1,8 +1,15 @@
-import json
 import os
 import sys
 import argparse
 
+import sleeper_codec
+
+def write_data_js(data, path='docs/data.js'):
+    # the docs site loads the trades as a global from a plain script
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    sleeper_codec.dump(data, path, prefix='const TRADES_DATA = ', suffix=';')
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate data.js from trades JSON file.')
     parser.add_argument('input_file', nargs='?', default='trades.json', help='Path to the input JSON file (default: trades.json)')
@@ -18,19 +25,14 @@ def main():
 
     try:
         # Read input json
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = sleeper_codec.load(input_path)
 
         # Write to docs/data.js
-        os.makedirs('docs', exist_ok=True)
-        with open('docs/data.js', 'w', encoding='utf-8') as f:
-            f.write('const TRADES_DATA = ')
-            json.dump(data, f, indent=2)
-            f.write(';')
+        write_data_js(data, 'docs/data.js')
         
         print(f"Successfully created docs/data.js from {input_path}")
 
-    except json.JSONDecodeError:
+    except sleeper_codec.DecodeError:
         print(f"Error: '{input_path}' is not a valid JSON file.")
         sys.exit(1)
     except Exception as e:
@@ -0,0 +1,225 @@
+import argparse
+import csv
+import os
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from value_index import DEFAULT_CROSSWALK_PATH, Crosswalk, ValueIndex, load_ktc_rows
+
+# Point-in-time KTC (or FantasyCalc) values. Every snapshot is one row of a dense int32 matrix
+# (snapshot x asset), with snapshot dates kept sorted so "value of X as of T" is a binary search
+# and valuing every asset of every trade is one searchsorted plus one fancy-indexing gather.
+#
+#   python ktc_snapshots.py add ktc_scraper/ktc.csv                 # date read from the CSV header
+#   python ktc_snapshots.py add old_ktc.csv --date 2023-08-15
+#   python ktc_snapshots.py add ktc_scraper/ktc.csv --column "FantasyCalc Value" --store fantasycalc.npz
+#   python ktc_snapshots.py info
+
+DEFAULT_SNAPSHOT_PATH = os.environ.get("SLEEPER_KTC_SNAPSHOTS", "ktc_snapshots.npz")
+
+# "Updated 12/07/25 at 01:20pm", the first header cell of a ktc_scraper export
+_UPDATED = re.compile(r"Updated (\d{2}/\d{2}/\d{2}) at (\d{1,2}:\d{2}[ap]m)", re.IGNORECASE)
+
+
+def player_key(player_id: str) -> str:
+    return f"p:{player_id}"
+
+
+def pick_key(season: Any, round_num: Any) -> str:
+    return f"k:{season}:{int(round_num)}"
+
+
+def csv_timestamp(csv_path: str) -> Optional[int]:
+    """
+    Get the export time of a ktc_scraper CSV (UNIX seconds, UTC) from its header, if it has one.
+    """
+    with open(csv_path, "r", encoding="utf-8") as f:
+        header = next(csv.reader(f), [])
+    match = _UPDATED.match(header[0]) if header else None
+    if not match:
+        return None
+    updated = datetime.strptime(f"{match.group(1)} {match.group(2).lower()}", "%m/%d/%y %I:%M%p")
+    return int(updated.replace(tzinfo=timezone.utc).timestamp())
+
+
+class SnapshotStore:
+    """
+    Time series of value snapshots, stored as one .npz file.
+
+    Arrays: timestamps (int64 UNIX seconds, ascending), keys (asset keys, see player_key and
+    pick_key) and values (int32, one row per snapshot, one column per key; 0 where the asset
+    was not listed).
+
+    Args:
+        path (str, optional): The .npz file (default is ktc_snapshots.npz, or SLEEPER_KTC_SNAPSHOTS).
+
+    Example:
+        >>> store = SnapshotStore()
+        >>> store.add(csv_timestamp("ktc_scraper/ktc.csv"), ValueIndex.from_csv("ktc_scraper/ktc.csv", api.player_records()))
+        >>> store.save()
+        >>> store.value_as_of(player_key("4046"), 1693526400)
+        9814
+    """
+
+    def __init__(self, path: str = DEFAULT_SNAPSHOT_PATH):
+        self.path = path
+        self.timestamps = np.zeros(0, dtype=np.int64)
+        self.keys: List[str] = []
+        self.values = np.zeros((0, 0), dtype=np.int32)
+        if os.path.exists(path):
+            with np.load(path, allow_pickle=False) as data:
+                self.timestamps = data["timestamps"]
+                self.keys = data["keys"].tolist()
+                self.values = data["values"]
+        self._columns = {key: i for i, key in enumerate(self.keys)}
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def add(self, timestamp: int, values: ValueIndex) -> None:
+        """
+        Add a snapshot taken at timestamp (UNIX seconds), replacing any snapshot at the same time.
+        """
+        snapshot = {player_key(player_id): value for player_id, value in values.player_values.items()}
+        snapshot.update({pick_key(season, round_num): value for (season, round_num), value in values.pick_values.items()})
+        new_keys = [key for key in snapshot if key not in self._columns]
+        if new_keys:
+            for key in new_keys:
+                self._columns[key] = len(self.keys)
+                self.keys.append(key)
+            self.values = np.pad(self.values, ((0, 0), (0, len(new_keys))))
+        row = np.zeros(len(self.keys), dtype=np.int32)
+        row[[self._columns[key] for key in snapshot]] = list(snapshot.values())
+
+        i = int(np.searchsorted(self.timestamps, timestamp))
+        if i < len(self.timestamps) and self.timestamps[i] == timestamp:
+            self.values[i] = row
+        else:
+            self.timestamps = np.insert(self.timestamps, i, timestamp)
+            self.values = np.insert(self.values, i, row, axis=0)
+
+    def save(self) -> None:
+        tmp_path = self.path + ".tmp.npz"
+        np.savez_compressed(tmp_path, timestamps=self.timestamps, keys=np.array(self.keys, dtype=str),
+                            values=self.values)
+        os.replace(tmp_path, self.path)
+
+    def snapshot_index(self, timestamps: np.ndarray) -> np.ndarray:
+        """
+        Get the row of the latest snapshot at or before each timestamp. Times before the first
+        snapshot use the first one, the closest there is.
+        """
+        rows = np.searchsorted(self.timestamps, timestamps, side="right") - 1
+        return np.maximum(rows, 0)
+
+    def value_as_of(self, key: str, timestamp: int) -> int:
+        """
+        Get the value of one asset as of a UNIX timestamp (0 if it was not listed then).
+        """
+        column = self._columns.get(key)
+        if column is None or not len(self):
+            return 0
+        return int(self.values[self.snapshot_index(np.array([timestamp]))[0], column])
+
+    def values_as_of(self, keys: Sequence[str], timestamps: np.ndarray) -> np.ndarray:
+        """
+        Vectorized as-of join: the value of keys[i] as of timestamps[i], for every i.
+        """
+        if not len(self):
+            return np.zeros(len(keys), dtype=np.int32)
+        # unknown keys point at an extra all-zero column
+        padded = np.pad(self.values, ((0, 0), (0, 1)))
+        missing = len(self.keys)
+        columns = np.fromiter((self._columns.get(key, missing) for key in keys), dtype=np.int64, count=len(keys))
+        return padded[self.snapshot_index(np.asarray(timestamps, dtype=np.int64)), columns]
+
+
+def enrich_trades_as_of(trade_infos: List[Dict[str, Any]], store: SnapshotStore,
+                        unmatched: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+    """
+    Like dankest.enrich_trades, but value every asset as of its trade's time_created.
+
+    A drafted pick traded before its draft has no player value yet at trade time, so it is
+    valued as the pick it was then (its season and round).
+
+    Example:
+        >>> store = SnapshotStore("")
+        >>> store.add(0, ValueIndex({"4046": 9000}, {("2025", 1): 5000}))
+        >>> pick = {"id": "9999", "round": 1, "season": "2025"}
+        >>> fallback = {"id": "4759", "round": "1", "slot": "1"}  # unresolved pick, no season
+        >>> trades = enrich_trades_as_of([{"time_created": 1000, "A": {"additions": [pick, fallback]}}], store)
+        >>> pick["value"], fallback["value"]
+        (5000, 0)
+    """
+    assets: List[Dict[str, Any]] = []
+    keys: List[str] = []
+    times: List[int] = []
+    for trade in trade_infos:
+        # time_created is in milliseconds
+        created = int(trade.get("time_created") or 0) // 1000
+        for team, sides in trade.items():
+            if team == 'time_created': continue
+            for asset in sides.get('additions', []) + sides.get('subtractions', []):
+                if asset.get('id'):
+                    keys.append(player_key(asset['id']))
+                elif 'season' in asset and 'round' in asset:
+                    keys.append(pick_key(asset['season'], asset['round']))
+                else:
+                    asset['value'] = 0
+                    continue
+                assets.append(asset)
+                times.append(created)
+
+    values = store.values_as_of(keys, np.array(times, dtype=np.int64))
+    # second pass for drafted picks that were still picks when traded
+    retry = [i for i, asset in enumerate(assets)
+             if values[i] == 0 and asset.get('id') and 'round' in asset and 'season' in asset]
+    if retry:
+        values[retry] = store.values_as_of([pick_key(assets[i]['season'], assets[i]['round']) for i in retry],
+                                           np.array([times[i] for i in retry], dtype=np.int64))
+    for asset, value in zip(assets, values.tolist()):
+        asset['value'] = value
+        if value == 0 and asset.get('id') and unmatched is not None:
+            unmatched[asset['id']] = asset.get('name')
+    return trade_infos
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Manage the point-in-time KTC value snapshot store.')
+    parser.add_argument('--store', default=DEFAULT_SNAPSHOT_PATH, help=f'Snapshot file (default: {DEFAULT_SNAPSHOT_PATH})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    add = subparsers.add_parser('add', help='Add a KTC export as a snapshot')
+    add.add_argument('csv', help='KTC export (see ktc_scraper)')
+    add.add_argument('--date', help='Snapshot date as YYYY-MM-DD (default: the "Updated" time in the CSV header)')
+    add.add_argument('--column', default='Value', help='Value column to store, e.g. "FantasyCalc Value" (default: Value)')
+    add.add_argument('--players', default=None, help='Players table JSON to match names against (default: the SleeperAPI players table)')
+    add.add_argument('--crosswalk', default=DEFAULT_CROSSWALK_PATH, help=f'KTC name crosswalk (default: {DEFAULT_CROSSWALK_PATH})')
+    subparsers.add_parser('info', help='Show the snapshots in the store')
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.store)
+    if args.command == 'add':
+        if args.date:
+            timestamp = int(datetime.strptime(args.date, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp())
+        else:
+            timestamp = csv_timestamp(args.csv)
+            if timestamp is None:
+                parser.error(f"no 'Updated' date in the header of {args.csv}; pass --date")
+        from sleeper_api_wrapper import SleeperAPI
+        api = SleeperAPI(players_cache_path=args.players) if args.players else SleeperAPI()
+        values = ValueIndex.build(load_ktc_rows(args.csv, args.column), api.player_records(), Crosswalk(args.crosswalk))
+        store.add(timestamp, values)
+        store.save()
+        api.close()
+        print(f"Added snapshot {datetime.fromtimestamp(timestamp, timezone.utc):%Y-%m-%d %H:%M} "
+              f"({len(values.player_values)} players, {len(values.pick_values)} picks) to {args.store}")
+    print(f"{len(store)} snapshots, {len(store.keys)} assets")
+    for timestamp, row in zip(store.timestamps.tolist(), store.values):
+        print(f"  {datetime.fromtimestamp(timestamp, timezone.utc):%Y-%m-%d %H:%M}  {int(np.count_nonzero(row))} values")
+
+
+if __name__ == "__main__":
+    main()
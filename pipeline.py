@@ -0,0 +1,196 @@
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import sleeper_codec
+from sleeper_metrics import StageTimings
+
+
+class PipelineError(Exception):
+    pass
+
+
+def file_hash(path: Optional[str]) -> Optional[str]:
+    """
+    SHA-256 of a file's contents, or None if there is no such file.
+    """
+    if not path or not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Stage:
+    """
+    One named step of a Pipeline.
+
+    Args:
+        name (str): Stage name, used for checkpoints and on the command line.
+        run (Callable[[Dict[str, Any]], Any]): Computes the stage output from the outputs of its
+            dependencies (by stage name). The output must be JSON-serializable.
+        deps (Sequence[str], optional): Stages whose outputs this one reads.
+        fingerprint (Callable[[], Any], optional): Extra inputs outside the pipeline (parameters,
+            hashes of input files) that are part of the stage's cache key.
+        volatile (bool, optional): The stage reads live data (the Sleeper API), so it runs every
+            time; stages downstream are still skipped when its output is unchanged.
+        valid (Callable[[Any], bool], optional): Checks that a cached output is still usable (e.g.
+            the files it wrote still exist), otherwise the stage runs again.
+    """
+
+    def __init__(self, name: str, run: Callable[[Dict[str, Any]], Any], deps: Sequence[str] = (),
+                 fingerprint: Optional[Callable[[], Any]] = None, volatile: bool = False,
+                 valid: Optional[Callable[[Any], bool]] = None):
+        self.name = name
+        self.run = run
+        self.deps = tuple(deps)
+        self.fingerprint = fingerprint
+        self.volatile = volatile
+        self.valid = valid
+
+
+class Pipeline:
+    """
+    Runs stages in order, checkpointing every stage output under a key that hashes the stage's
+    inputs: the content of its dependencies' outputs and its fingerprint. A rerun only executes
+    stages whose inputs changed, so after a crash it picks up at the stage that failed.
+
+    Checkpoints live in checkpoint_dir as <stage>/<key>.json, with a manifest of the latest key of
+    every stage. With checkpoint_dir=None nothing is persisted and every stage runs.
+
+    Args:
+        stages (List[Stage]): The stages, in dependency order.
+        checkpoint_dir (str, optional): Where checkpoints are kept (default is none).
+
+    Example:
+        >>> pipeline = Pipeline(stages, ".pipeline")
+        >>> result = pipeline.run()                      # skips everything unchanged since last time
+        >>> result = pipeline.run(only=["enrich", "write"])  # the rest comes from checkpoints
+        >>> result = pipeline.run(force=["transactions"])
+    """
+
+    def __init__(self, stages: List[Stage], checkpoint_dir: Optional[str] = None):
+        self.stages = stages
+        self.checkpoint_dir = checkpoint_dir
+        names = [stage.name for stage in stages]
+        for i, stage in enumerate(stages):
+            for dep in stage.deps:
+                if dep not in names[:i]:
+                    raise PipelineError(f"stage {stage.name!r} depends on {dep!r}, which does not run before it")
+        self._manifest: Dict[str, Dict[str, str]] = {}
+        if checkpoint_dir and os.path.exists(self._manifest_path()):
+            self._manifest = sleeper_codec.load(self._manifest_path())
+
+    @property
+    def names(self) -> List[str]:
+        return [stage.name for stage in self.stages]
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.checkpoint_dir, "manifest.json")
+
+    def _checkpoint_path(self, name: str, key: str) -> str:
+        return os.path.join(self.checkpoint_dir, name, f"{key}.json")
+
+    def _save(self, name: str, key: str, output: Any) -> str:
+        # write the checkpoint, drop the stage's older ones and record it in the manifest
+        body = sleeper_codec.dumps(output)
+        path = self._checkpoint_path(name, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "wb") as f:
+            f.write(body)
+        os.replace(path + ".tmp", path)
+        for old in os.listdir(os.path.dirname(path)):
+            if old != f"{key}.json":
+                os.remove(os.path.join(os.path.dirname(path), old))
+        content_hash = hashlib.sha256(body).hexdigest()
+        self._manifest[name] = {"key": key, "hash": content_hash}
+        sleeper_codec.dump(self._manifest, self._manifest_path() + ".tmp")
+        os.replace(self._manifest_path() + ".tmp", self._manifest_path())
+        return content_hash
+
+    def _key(self, stage: Stage, dep_hashes: Dict[str, str]) -> str:
+        material = {"stage": stage.name, "deps": dep_hashes,
+                    "fingerprint": stage.fingerprint() if stage.fingerprint is not None else None}
+        return hashlib.sha256(json.dumps(material, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:24]
+
+    def run(self, only: Optional[Iterable[str]] = None, force: Iterable[str] = (), resume: bool = False,
+            timings: Optional[StageTimings] = None) -> "PipelineResult":
+        """
+        Run the pipeline.
+
+        Args:
+            only (Iterable[str], optional): Run just these stages; every other stage's output is
+                taken from its latest checkpoint, which must exist.
+            force (Iterable[str], optional): Run these stages even if their checkpoint is current.
+            resume (bool, optional): Reuse the checkpoints of volatile stages too, continuing an
+                interrupted run without fetching again.
+            timings (StageTimings, optional): Collects the wall time of stages that ran.
+
+        Returns:
+            PipelineResult: Stage outputs, loaded from checkpoints on demand.
+        """
+        only = set(only) if only is not None else None
+        force = set(force)
+        for name in (only or set()) | force:
+            if name not in self.names:
+                raise PipelineError(f"unknown stage {name!r} (stages: {', '.join(self.names)})")
+        timings = timings if timings is not None else StageTimings()
+        result = PipelineResult(self)
+        for stage in self.stages:
+            if self.checkpoint_dir is None:
+                with timings.stage(stage.name):
+                    result.outputs[stage.name] = stage.run({dep: result.output(dep) for dep in stage.deps})
+                result.ran.append(stage.name)
+                continue
+
+            if only is not None and stage.name not in only:
+                latest = self._manifest.get(stage.name)
+                if latest is None or not os.path.exists(self._checkpoint_path(stage.name, latest["key"])):
+                    raise PipelineError(f"stage {stage.name!r} has no checkpoint yet; run it first")
+                result.keys[stage.name] = latest["key"]
+                result.hashes[stage.name] = latest["hash"]
+                continue
+
+            key = self._key(stage, {dep: result.hashes[dep] for dep in stage.deps})
+            latest = self._manifest.get(stage.name)
+            cached = (latest is not None and latest["key"] == key and stage.name not in force
+                      and (not stage.volatile or resume) and os.path.exists(self._checkpoint_path(stage.name, key)))
+            if cached and stage.valid is not None and not stage.valid(result.output(stage.name, key)):
+                cached = False
+            if cached:
+                print(f"[{stage.name}] up to date, skipped")
+                result.keys[stage.name] = key
+                result.hashes[stage.name] = latest["hash"]
+                continue
+
+            with timings.stage(stage.name):
+                output = stage.run({dep: result.output(dep) for dep in stage.deps})
+                result.hashes[stage.name] = self._save(stage.name, key, output)
+            result.keys[stage.name] = key
+            result.outputs[stage.name] = output
+            result.ran.append(stage.name)
+        return result
+
+
+class PipelineResult:
+    """
+    Outputs of a pipeline run. Outputs of skipped stages are read from their checkpoints only
+    when asked for.
+    """
+
+    def __init__(self, pipeline: Pipeline):
+        self.pipeline = pipeline
+        self.outputs: Dict[str, Any] = {}
+        self.keys: Dict[str, str] = {}
+        self.hashes: Dict[str, str] = {}
+        # stages that actually executed, in order
+        self.ran: List[str] = []
+
+    def output(self, name: str, key: Optional[str] = None) -> Any:
+        if name not in self.outputs:
+            path = self.pipeline._checkpoint_path(name, key or self.keys[name])
+            self.outputs[name] = sleeper_codec.load(path)
+        return self.outputs[name]
@@ -0,0 +1,390 @@
+import argparse
+import codecs
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# where SleeperAPI looks for the compact index; override per machine with SLEEPER_PLAYER_INDEX
+DEFAULT_PLAYER_INDEX_PATH = os.environ.get("SLEEPER_PLAYER_INDEX", "players.sqlite")
+
+# the player fields the index keeps unless told otherwise
+PLAYER_FIELDS = ("full_name", "position", "team", "age")
+
+# read size when streaming a players dump
+CHUNK_SIZE = 64 * 1024
+
+
+# append-only log of field-level changes applied by update_player_index
+_CHANGES_SCHEMA = "CREATE TABLE IF NOT EXISTS changes (ts REAL NOT NULL, player_id TEXT NOT NULL, field TEXT NOT NULL, old, new)"
+
+
+def _normalize(value: Any) -> Any:
+    # the form a field value is stored in: empty means missing, lists/dicts become JSON text and
+    # bools become ints, as SQLite returns them
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return value
+
+
+def iter_players(chunks: Iterable[bytes]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Incrementally parse a /players dump ({player_id: {...}, ...}) from a stream of byte chunks.
+
+    Only one player object (plus one chunk) is buffered at a time, so memory stays bounded no
+    matter how large the dump is.
+
+    Args:
+        chunks (Iterable[bytes]): The raw body, e.g. response.iter_content(65536) or file reads.
+
+    Yields:
+        Tuple[str, Dict[str, Any]]: (player_id, player) pairs in document order.
+
+    Example:
+        >>> with open("players.json", "rb") as f:
+        ...     for player_id, player in iter_players(iter(lambda: f.read(65536), b"")):
+        ...         ...
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buf = ""
+    pos = 0
+    done = False
+
+    def fill() -> bool:
+        # append the next chunk, dropping what has been consumed; False once the stream is exhausted
+        nonlocal buf, pos, done
+        chunk = next(chunks, None)
+        if chunk is None:
+            done = True
+            buf = buf[pos:] + text_decoder.decode(b"", final=True)
+        else:
+            buf = buf[pos:] + text_decoder.decode(chunk)
+        pos = 0
+        return not done
+
+    def skip_ws() -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf) or not fill():
+                return
+
+    def expect(chars: str) -> str:
+        nonlocal pos
+        skip_ws()
+        if pos >= len(buf) or buf[pos] not in chars:
+            raise ValueError(f"Malformed players dump: expected one of {chars!r} at offset {pos}")
+        pos += 1
+        return buf[pos - 1]
+
+    def value() -> Any:
+        nonlocal pos
+        skip_ws()
+        while True:
+            try:
+                result, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if not fill():
+                    raise
+                continue
+            # a value that runs to the end of the buffer may be cut short (e.g. a number)
+            if end == len(buf) and not done:
+                fill()
+                continue
+            pos = end
+            return result
+
+    expect("{")
+    skip_ws()
+    if pos < len(buf) and buf[pos] == "}":
+        return
+    while True:
+        player_id = value()
+        expect(":")
+        yield player_id, value()
+        if expect(",}") == "}":
+            return
+
+
+def build_player_index(players: Union[Dict[str, Dict[str, Any]], Iterable[Tuple[str, Dict[str, Any]]]],
+                       path: str = DEFAULT_PLAYER_INDEX_PATH, fields: Sequence[str] = PLAYER_FIELDS) -> int:
+    """
+    Build a compact on-disk player index from a /players dump.
+
+    Only the given fields are kept. Every distinct value is interned once in a values table and
+    players refer to it by integer ID, keyed by player_id in a WITHOUT ROWID table, so a lookup is
+    a single B-tree probe and nothing is parsed at load time. Rows are written in batches, so the
+    dump can be streamed in (see iter_players) without ever holding it in memory.
+
+    Args:
+        players: The players dump keyed by player_id (SleeperAPI.get_players), or (player_id, player) pairs.
+        path (str, optional): Where to write the index; an existing file is replaced.
+        fields (Sequence[str], optional): Player fields to keep (default is PLAYER_FIELDS).
+
+    Returns:
+        int: The number of players written.
+
+    Example:
+        >>> build_player_index(api.get_players(), "players.sqlite")
+        11402
+    """
+    for field in fields:
+        if not field.isidentifier() or field == "player_id":
+            raise ValueError(f"Invalid player field: {field!r}")
+    tmp_path = path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    # the value column has no type affinity, so 25 stays an INTEGER and "KC" stays TEXT
+    conn.execute("CREATE TABLE vals (id INTEGER PRIMARY KEY, value)")
+    columns = ", ".join(f'"{field}" INTEGER' for field in fields)
+    conn.execute(f"CREATE TABLE players (player_id TEXT PRIMARY KEY, {columns}) WITHOUT ROWID")
+    conn.execute(_CHANGES_SCHEMA)
+    insert = f"INSERT INTO players VALUES (?{', ?' * len(fields)})"
+    interned: Dict[Tuple[type, Any], int] = {}
+    new_values: List[Tuple[int, Any]] = []
+
+    def intern(value: Any) -> Optional[int]:
+        value = _normalize(value)
+        if value is None:
+            return None
+        key = (type(value), value)
+        value_id = interned.get(key)
+        if value_id is None:
+            value_id = len(interned) + 1
+            interned[key] = value_id
+            new_values.append((value_id, value))
+        return value_id
+
+    items = players.items() if isinstance(players, dict) else players
+    count = 0
+    rows = []
+    for player_id, player in items:
+        if not player:
+            continue
+        rows.append((str(player_id),) + tuple(intern(player.get(field)) for field in fields))
+        count += 1
+        if len(rows) >= 1000:
+            conn.executemany("INSERT INTO vals VALUES (?, ?)", new_values)
+            conn.executemany(insert, rows)
+            new_values.clear()
+            rows.clear()
+    conn.executemany("INSERT INTO vals VALUES (?, ?)", new_values)
+    conn.executemany(insert, rows)
+    conn.execute("CREATE INDEX vals_value ON vals (value)")
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+    os.replace(tmp_path, path)
+    return count
+
+
+def update_player_index(players: Union[Dict[str, Dict[str, Any]], Iterable[Tuple[str, Dict[str, Any]]]],
+                        path: str = DEFAULT_PLAYER_INDEX_PATH) -> List[Dict[str, Any]]:
+    """
+    Apply a new /players dump to an existing index in place, touching only what changed.
+
+    Each incoming player is compared field by field with its stored row (for the fields the index
+    was built with). Changed and new players are rewritten, players missing from the dump are
+    removed, and every field-level change is appended to the index's change log with a timestamp.
+    Readers (PlayerIndex, including the one held by SleeperAPI) see the new data without reopening.
+
+    Args:
+        players: The new dump keyed by player_id, or (player_id, player) pairs (see iter_players).
+        path (str, optional): The index to update.
+
+    Returns:
+        List[Dict[str, Any]]: The changes applied (ts, player_id, field, old, new).
+
+    Example:
+        >>> update_player_index(api.get_players(), "players.sqlite")
+        [
+          {"ts": 1765432100.0, "player_id": "8138", "field": "team", "old": "BUF", "new": "KC"},
+          ...
+        ]
+    """
+    now = time.time()
+    conn = sqlite3.connect(path)
+    # WAL lets open PlayerIndex readers keep reading while the update commits
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(_CHANGES_SCHEMA)
+    conn.execute("CREATE INDEX IF NOT EXISTS vals_value ON vals (value)")
+    fields = [row[1] for row in conn.execute("PRAGMA table_info(players)") if row[1] != "player_id"]
+    joins = " ".join(f'LEFT JOIN vals v{i} ON v{i}.id = p."{field}"' for i, field in enumerate(fields))
+    selects = ", ".join(f"v{i}.value" for i in range(len(fields)))
+    select_row = f"SELECT {selects} FROM players p {joins} WHERE p.player_id = ?"
+    upsert = f"INSERT OR REPLACE INTO players VALUES (?{', ?' * len(fields)})"
+
+    def intern(value: Any) -> Optional[int]:
+        if value is None:
+            return None
+        for value_id, stored in conn.execute("SELECT id, value FROM vals WHERE value = ?", (value,)):
+            # 25 and 25.0 compare equal in SQLite; keep them apart like build_player_index does
+            if type(stored) is type(value):
+                return value_id
+        return conn.execute("INSERT INTO vals (value) VALUES (?)", (value,)).lastrowid
+
+    changes = []
+    seen = set()
+    items = players.items() if isinstance(players, dict) else players
+    for player_id, player in items:
+        if not player:
+            continue
+        player_id = str(player_id)
+        seen.add(player_id)
+        new = tuple(_normalize(player.get(field)) for field in fields)
+        row = conn.execute(select_row, (player_id,)).fetchone()
+        old = tuple(row) if row is not None else (None,) * len(fields)
+        if row is not None and old == new and all(type(a) is type(b) for a, b in zip(old, new)):
+            continue
+        for field, old_value, new_value in zip(fields, old, new):
+            if old_value != new_value or type(old_value) is not type(new_value):
+                changes.append({"ts": now, "player_id": player_id, "field": field, "old": old_value, "new": new_value})
+        conn.execute(upsert, (player_id,) + tuple(intern(value) for value in new))
+    for (player_id,) in conn.execute("SELECT player_id FROM players").fetchall():
+        if player_id in seen:
+            continue
+        row = conn.execute(select_row, (player_id,)).fetchone()
+        for field, old_value in zip(fields, row):
+            if old_value is not None:
+                changes.append({"ts": now, "player_id": player_id, "field": field, "old": old_value, "new": None})
+        conn.execute("DELETE FROM players WHERE player_id = ?", (player_id,))
+    conn.executemany(
+        "INSERT INTO changes (ts, player_id, field, old, new) VALUES (:ts, :player_id, :field, :old, :new)", changes
+    )
+    conn.commit()
+    conn.close()
+    return changes
+
+
+class PlayerIndex:
+    """
+    Read-only view of an index written by build_player_index. Opening it costs a few
+    milliseconds and almost no memory; each lookup reads one row. The stored fields are
+    read from the file (see fields).
+
+    Args:
+        path (str, optional): Path of the index file.
+
+    Example:
+        >>> index = PlayerIndex("players.sqlite")
+        >>> index.name("4046")
+        "Patrick Mahomes"
+        >>> index.get("4046")
+        {"player_id": "4046", "full_name": "Patrick Mahomes", "position": "QB", "team": "KC", "age": 30}
+    """
+
+    def __init__(self, path: str = DEFAULT_PLAYER_INDEX_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self.fields = tuple(row[1] for row in self._conn.execute("PRAGMA table_info(players)") if row[1] != "player_id")
+        joins = " ".join(f'LEFT JOIN vals v{i} ON v{i}.id = p."{field}"' for i, field in enumerate(self.fields))
+        selects = ", ".join(f"v{i}.value" for i in range(len(self.fields)))
+        self._query = f"SELECT p.player_id, {selects} FROM players p {joins} WHERE p.player_id = ?"
+
+    def get(self, player_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the compact record of a player, or None if unknown.
+        """
+        with self._lock:
+            row = self._conn.execute(self._query, (str(player_id),)).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("player_id",) + self.fields, row))
+
+    def name(self, player_id: str) -> Optional[str]:
+        """
+        Get a player's full name, or None if unknown.
+        """
+        if "full_name" not in self.fields:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT v.value FROM players p JOIN vals v ON v.id = p.full_name WHERE p.player_id = ?",
+                (str(player_id),),
+            ).fetchone()
+        return row[0] if row else None
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the compact records of every player.
+        """
+        with self._lock:
+            rows = self._conn.execute(self._query.replace(" WHERE p.player_id = ?", "")).fetchall()
+        for row in rows:
+            yield dict(zip(("player_id",) + self.fields, row))
+
+    def changes(self, since: Optional[float] = None, player_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Read the change log written by update_player_index, oldest first.
+
+        Args:
+            since (float, optional): Only changes at or after this UNIX timestamp.
+            player_id (str, optional): Only changes to this player.
+
+        Example:
+            >>> index.changes(since=time.time() - 7 * 86400, player_id="8138")
+            [{"ts": 1765432100.0, "player_id": "8138", "field": "team", "old": "BUF", "new": "KC"}]
+        """
+        query = "SELECT ts, player_id, field, old, new FROM changes WHERE 1 = 1"
+        params: List[Any] = []
+        if since is not None:
+            query += " AND ts >= ?"
+            params.append(since)
+        if player_id is not None:
+            query += " AND player_id = ?"
+            params.append(str(player_id))
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY ts, rowid", params).fetchall()
+        return [dict(zip(("ts", "player_id", "field", "old", "new"), row)) for row in rows]
+
+    def __contains__(self, player_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM players WHERE player_id = ?", (str(player_id),)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the compact player index from a /players dump.')
+    parser.add_argument('input_file', nargs='?', help='players.json dump to read (default: stream it from the Sleeper API)')
+    parser.add_argument('-o', '--output', default=DEFAULT_PLAYER_INDEX_PATH, help=f'Index file to write (default: {DEFAULT_PLAYER_INDEX_PATH})')
+    parser.add_argument('--delta', action='store_true', help='Update an existing index in place and log what changed')
+    parser.add_argument('--fields', default=",".join(PLAYER_FIELDS), help=f'Comma-separated player fields to keep (default: {",".join(PLAYER_FIELDS)})')
+    args = parser.parse_args()
+    fields = [field.strip() for field in args.fields.split(",") if field.strip()]
+
+    delta = args.delta and os.path.exists(args.output)
+    if args.input_file:
+        print(f"Reading players from {args.input_file}...")
+        with open(args.input_file, 'rb') as f:
+            players = iter_players(iter(lambda: f.read(CHUNK_SIZE), b""))
+            if delta:
+                count = len({change["player_id"] for change in update_player_index(players, args.output)})
+            else:
+                count = build_player_index(players, args.output, fields)
+    else:
+        from sleeper_api_wrapper import SleeperAPI
+        print("Streaming players from the Sleeper API...")
+        count = SleeperAPI(player_index_path=None).refresh_player_index(args.output, fields, delta=delta)
+    print(f"Wrote {count} players to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import random
+import threading
+import time
+from typing import Optional
+
+# Sleeper asks clients to stay under 1000 calls per minute; leave some headroom.
+DEFAULT_REQUESTS_PER_MINUTE = 900
+
+# status codes worth retrying: rate limited or a transient server-side failure
+TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at requests_per_minute / 60 per second up to burst. acquire()
+    reserves a token under a lock and then sleeps outside it, so any number of threads (including
+    the worker threads AsyncSleeperAPI runs requests on) can share one bucket.
+
+    Args:
+        requests_per_minute (float): Sustained request budget.
+        burst (int, optional): Bucket capacity (default is one second's worth of requests, at least 1).
+
+    Example:
+        >>> limiter = TokenBucket(600)
+        >>> api_a = SleeperAPI(rate_limiter=limiter)
+        >>> api_b = SleeperAPI(rate_limiter=limiter)  # both clients share the 600/min budget
+    """
+
+    def __init__(self, requests_per_minute: float, burst: Optional[int] = None):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = burst if burst is not None else max(1, int(self.rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token and return how many seconds the caller must wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """
+        Block until a token is available. Returns the time spent waiting in seconds.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for transient failures (connection errors, timeouts,
+    429 and 5xx responses). A Retry-After header on the response takes precedence.
+
+    Args:
+        max_retries (int, optional): Retries after the first attempt (default is 5).
+        base_delay (float, optional): Delay cap in seconds for the first retry (default is 0.5).
+        max_delay (float, optional): Upper bound on any single delay in seconds (default is 30).
+
+    Example:
+        >>> RetryPolicy(max_retries=3).delay(2)  # somewhere in [0, 2.0]
+        1.37
+    """
+
+    def __init__(self, max_retries: int = 5, base_delay: float = 0.5, max_delay: float = 30.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Get the delay in seconds before retry number attempt + 1 (attempt starts at 0).
+        """
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_delay)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
@@ -0,0 +1,88 @@
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+# (connect, read) timeouts in seconds; the /players dump is the slowest response by far
+DEFAULT_TIMEOUT: Tuple[float, float] = (3.05, 30.0)
+
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+
+class SessionPool:
+    """
+    A bounded pool of requests.Session objects for use from many threads.
+
+    A requests.Session is not safe to share between threads, so each request checks a session
+    out, uses it alone and puts it back. Sessions are created lazily up to size and handed out
+    most-recently-used first, so callers keep landing on sessions with warm keep-alive (TLS)
+    connections even when the calling threads themselves are short-lived.
+
+    Args:
+        size (int): Maximum number of sessions; checkouts beyond that wait for one to be returned.
+        connections_per_session (int, optional): urllib3 pool size of each session (default is 2, so a
+            streamed response and a regular request can share one session).
+        transport (Callable[[], BaseAdapter], optional): Builds the adapter mounted on each session in
+            place of a plain HTTPAdapter, e.g. sleeper_replay.ReplayAdapter for offline runs.
+
+    Example:
+        >>> pool = SessionPool(8)
+        >>> with pool.session() as session:
+        ...     session.get("https://api.sleeper.app/v1/state/nfl", timeout=DEFAULT_TIMEOUT)
+    """
+
+    def __init__(self, size: int, connections_per_session: int = 2,
+                 transport: Optional[Callable[[], BaseAdapter]] = None):
+        self.size = max(1, size)
+        self.connections_per_session = connections_per_session
+        self.transport = transport
+        self._idle: "queue.LifoQueue[requests.Session]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        # retries are handled by SleeperAPI (see rate_limiter.RetryPolicy), not by urllib3
+        if self.transport is not None:
+            adapter = self.transport()
+        else:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.connections_per_session, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @contextmanager
+    def session(self) -> Iterator[requests.Session]:
+        """
+        Check out a session for the duration of a with block.
+        """
+        try:
+            session = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            session = self._new_session() if create else self._idle.get()
+        try:
+            yield session
+        finally:
+            self._idle.put(session)
+
+    def close(self) -> None:
+        """
+        Close every idle session (and its connections).
+        """
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
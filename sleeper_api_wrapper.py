@@ -1,23 +1,186 @@
 import os.path
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
-from typing import Any, Dict, List, Optional
+from requests.adapters import BaseAdapter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from player_index import (CHUNK_SIZE, DEFAULT_PLAYER_INDEX_PATH, PLAYER_FIELDS, PlayerIndex, build_player_index,
+                          iter_players, update_player_index)
+import sleeper_codec
+from rate_limiter import DEFAULT_REQUESTS_PER_MINUTE, TRANSIENT_STATUS_CODES, RetryPolicy, TokenBucket
+from sleeper_cache import ResponseCache
+from sleeper_index import DraftIndex, LeagueHistory, LeagueIndex
+from sleeper_metrics import RequestMetrics
+from session_pool import DEFAULT_TIMEOUT, SessionPool
 
 BASE = "https://api.sleeper.app/v1"
+# default number of concurrent requests for the fan-out helpers; keep it polite
+DEFAULT_MAX_WORKERS = 8
+# where the players table is read from; override per machine with SLEEPER_PLAYERS_CACHE
+DEFAULT_PLAYERS_CACHE_PATH = os.environ.get("SLEEPER_PLAYERS_CACHE", "players.json")
 
 
 class SleeperAPI:
-    def __init__(self, players_cache_path: str = r"C:\Projects\Sleeper\players.json"):
-        self.session = requests.Session()
-        # read players from file if provided file exists otherwise fetch from API
-        if os.path.exists(players_cache_path):
-            print("Loading players from cache file")
-            import json
-            with open(players_cache_path, "r") as f:
-                self._cached_players = json.load(f)
-        else:
-            print("WARNING: Players cache file not found, fetching from API")
-            self._cached_players = self.get_players()
+    def __init__(self, players_cache_path: str = DEFAULT_PLAYERS_CACHE_PATH,
+                 cache: Optional[ResponseCache] = None, max_workers: int = DEFAULT_MAX_WORKERS,
+                 requests_per_minute: Optional[float] = DEFAULT_REQUESTS_PER_MINUTE,
+                 rate_limiter: Optional[TokenBucket] = None, retry: Optional[RetryPolicy] = None,
+                 metrics: Optional[RequestMetrics] = None, warm_players: bool = False,
+                 player_index_path: Optional[str] = DEFAULT_PLAYER_INDEX_PATH, pool_size: Optional[int] = None,
+                 timeout: Tuple[float, float] = DEFAULT_TIMEOUT, base_url: str = BASE,
+                 transport: Optional[Callable[[], BaseAdapter]] = None):
+        # requests.Session is not thread-safe, so every request checks one out of a pool sized so
+        # each fan-out worker can reuse a session with a warm keep-alive connection
+        self.max_workers = max_workers
+        self.sessions = SessionPool(pool_size or max_workers, transport=transport)
+        self.timeout = timeout
+        # point at a local stand-in (see sleeper_replay.py) instead of the live API
+        self.base_url = base_url.rstrip("/")
+        # optional on-disk response cache, see sleeper_cache.ResponseCache
+        self.cache = cache
+        # shared request budget (pass the same TokenBucket to several clients to share it);
+        # requests_per_minute=None disables throttling
+        if rate_limiter is None and requests_per_minute:
+            rate_limiter = TokenBucket(requests_per_minute)
+        self.rate_limiter = rate_limiter
+        self.retry = retry if retry is not None else RetryPolicy()
+        # per-endpoint call counts, bytes, cache hits and latencies, see sleeper_metrics.RequestMetrics
+        self.metrics = metrics if metrics is not None else RequestMetrics()
+        # league_id -> LeagueIndex, see get_league_index
+        self._league_indexes: Dict[str, LeagueIndex] = {}
+        # draft_id -> DraftIndex, see get_draft_index
+        self._draft_indexes: Dict[Optional[str], DraftIndex] = {}
+        # current league_id -> LeagueHistory, see get_league_history
+        self._league_histories: Dict[str, LeagueHistory] = {}
+        # one lock per (cache, key), so concurrent callers build each of the above only once
+        self._build_locks: Dict[Tuple[str, Any], threading.Lock] = {}
+        self._build_locks_lock = threading.Lock()
+        # the players table is loaded on first use (or in the background via warm_players)
+        self.players_cache_path = players_cache_path
+        self._cached_players: Optional[Dict[str, Any]] = None
+        self._players_lock = threading.Lock()
+        # compact on-disk index (see player_index.py); preferred over the full table when it exists
+        self.player_index_path = player_index_path
+        self._player_index: Optional[PlayerIndex] = None
+        if player_index_path and os.path.exists(player_index_path):
+            self._player_index = PlayerIndex(player_index_path)
+        if warm_players and self._player_index is None:
+            self.warm_players()
+
+    def close(self) -> None:
+        """
+        Close pooled HTTP sessions and the player index.
+        """
+        self.sessions.close()
+        if self._player_index is not None:
+            self._player_index.close()
+
+    def players(self) -> Dict[str, Any]:
+        """
+        Get the players table, loading it on first use.
+
+        The table is read from players_cache_path if that file exists, otherwise fetched from the
+        API. Concurrent callers wait for a single load (including one started by warm_players).
+
+        Returns:
+            Dict[str, Any]: All players, keyed by player_id.
+        """
+        if self._cached_players is None:
+            with self._players_lock:
+                if self._cached_players is None:
+                    # read players from file if provided file exists otherwise fetch from API
+                    if os.path.exists(self.players_cache_path):
+                        print("Loading players from cache file")
+                        self._cached_players = sleeper_codec.load(self.players_cache_path)
+                    else:
+                        print("WARNING: Players cache file not found, fetching from API")
+                        self._cached_players = self.get_players()
+        return self._cached_players
+
+    def warm_players(self) -> threading.Thread:
+        """
+        Start loading the players table on a background thread so it is ready by the time a name is needed.
+
+        Returns:
+            threading.Thread: The (daemon) loader thread.
+        """
+        thread = threading.Thread(target=self.players, name="sleeper-players", daemon=True)
+        thread.start()
+        return thread
+
+    def _get(self, path: str) -> Any:
+        """
+        GET a path relative to BASE and decode the JSON body, going through the response cache if set.
+
+        Args:
+            path (str): The request path (e.g. "/league/1182986456149786624").
+
+        Returns:
+            Any: The decoded JSON response.
+
+        Raises:
+            requests.HTTPError: If the response is still an error after retries.
+        """
+        return self._fetch(path, decode=True)[1]
+
+    def _get_bytes(self, path: str) -> bytes:
+        # raw response body for a path, from the response cache when possible
+        return self._fetch(path)[0]
+
+    def _fetch(self, path: str, decode: bool = False) -> Tuple[bytes, Any]:
+        # body and (if decode) decoded payload; a fresh payload is handed to the cache so it is
+        # not decoded twice for the completed-status check
+        start = time.perf_counter()
+        if self.cache is not None:
+            body = self.cache.get(path)
+            if body is not None:
+                self.metrics.record(path, time.perf_counter() - start, len(body), cache_hit=True)
+                return body, sleeper_codec.loads(body) if decode else None
+        response, retries = self._request(path)
+        body = response.content
+        self.metrics.record(path, time.perf_counter() - start, len(body), cache_hit=False, retries=retries)
+        payload = sleeper_codec.loads(body) if decode else None
+        if self.cache is not None:
+            self.cache.set(path, body, payload)
+        return body, payload
+
+    def _build_once(self, kind: str, cache: Dict[Any, Any], key: Any, build: Callable[[], Any]) -> Any:
+        # get cache[key], building it if missing; a caller arriving mid-build waits for that build
+        value = cache.get(key)
+        if value is not None:
+            return value
+        with self._build_locks_lock:
+            lock = self._build_locks.setdefault((kind, key), threading.Lock())
+        with lock:
+            value = cache.get(key)
+            if value is None:
+                value = build()
+                cache[key] = value
+        return value
+
+    def _request(self, path: str, stream: bool = False) -> Tuple[requests.Response, int]:
+        # throttled GET with jittered exponential backoff on connection errors, 429 and 5xx;
+        # returns the response and the number of retries it took
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                with self.sessions.session() as session:
+                    response = session.get(f"{self.base_url}{path}", stream=stream, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.retry.max_retries:
+                    raise
+                time.sleep(self.retry.delay(attempt))
+            else:
+                if response.status_code not in TRANSIENT_STATUS_CODES or attempt >= self.retry.max_retries:
+                    response.raise_for_status()
+                    return response, attempt
+                time.sleep(self.retry.delay(attempt, response.headers.get("Retry-After")))
+            attempt += 1
 
     # -------------------------
     # USER ENDPOINTS
@@ -44,7 +207,7 @@ class SleeperAPI:
               ...
             }
         """
-        return self.session.get(f"{BASE}/user/{username}").json()
+        return self._get(f"/user/{username}")
 
     def get_user_leagues(self, user_id: str, season: int, sport: str = "nfl") -> List[Dict[str, Any]]:
         """
@@ -73,7 +236,7 @@ class SleeperAPI:
               ...
             ]
         """
-        return self.session.get(f"{BASE}/user/{user_id}/leagues/{sport}/{season}").json()
+        return self._get(f"/user/{user_id}/leagues/{sport}/{season}")
 
     def get_user_drafts(self, user_id: str, sport: str = "nfl") -> List[Dict[str, Any]]:
         """
@@ -98,7 +261,7 @@ class SleeperAPI:
               }
             ]
         """
-        return self.session.get(f"{BASE}/user/{user_id}/drafts/{sport}").json()
+        return self._get(f"/user/{user_id}/drafts/{sport}")
 
     # -------------------------
     # LEAGUE ENDPOINTS
@@ -125,7 +288,7 @@ class SleeperAPI:
               ...
             }
         """
-        return self.session.get(f"{BASE}/league/{league_id}").json()
+        return self._get(f"/league/{league_id}")
 
     def get_league_users(self, league_id: str) -> List[Dict[str, Any]]:
         """
@@ -149,7 +312,7 @@ class SleeperAPI:
               ...
             ]
         """
-        return self.session.get(f"{BASE}/league/{league_id}/users").json()
+        return self._get(f"/league/{league_id}/users")
 
     def get_league_rosters(self, league_id: str) -> List[Dict[str, Any]]:
         """
@@ -175,7 +338,7 @@ class SleeperAPI:
               ...
             ]
         """
-        return self.session.get(f"{BASE}/league/{league_id}/rosters").json()
+        return self._get(f"/league/{league_id}/rosters")
 
     def get_league_matchups(self, league_id: str, week: int) -> List[Dict[str, Any]]:
         """
@@ -201,7 +364,7 @@ class SleeperAPI:
               ...
             ]
         """
-        return self.session.get(f"{BASE}/league/{league_id}/matchups/{week}").json()
+        return self._get(f"/league/{league_id}/matchups/{week}")
 
     def get_league_transactions(self, league_id: str, week: int) -> List[Dict[str, Any]]:
         """
@@ -229,7 +392,7 @@ class SleeperAPI:
               ...
             ]
         """
-        return self.session.get(f"{BASE}/league/{league_id}/transactions/{week}").json()
+        return self._get(f"/league/{league_id}/transactions/{week}")
 
     def get_league_winners_bracket(self, league_id: str):
         """
@@ -254,7 +417,7 @@ class SleeperAPI:
               ...
             ]
         """
-        return self.session.get(f"{BASE}/league/{league_id}/winners_bracket").json()
+        return self._get(f"/league/{league_id}/winners_bracket")
 
     def get_league_losers_bracket(self, league_id: str):
         """
@@ -279,7 +442,7 @@ class SleeperAPI:
               ...
             ]
         """
-        return self.session.get(f"{BASE}/league/{league_id}/losers_bracket").json()
+        return self._get(f"/league/{league_id}/losers_bracket")
 
     # -------------------------
     # DRAFT ENDPOINTS
@@ -306,7 +469,7 @@ class SleeperAPI:
               ...
             }
         """
-        return self.session.get(f"{BASE}/draft/{draft_id}").json()
+        return self._get(f"/draft/{draft_id}")
 
     def get_draft_picks(self, draft_id: str) -> List[Dict[str, Any]]:
         """
@@ -333,7 +496,7 @@ class SleeperAPI:
               ...
             ]
         """
-        return self.session.get(f"{BASE}/draft/{draft_id}/picks").json()
+        return self._get(f"/draft/{draft_id}/picks")
 
     def get_draft_traded_picks(self, draft_id: str) -> List[Dict[str, Any]]:
         """
@@ -359,7 +522,7 @@ class SleeperAPI:
               ...
             ]
         """
-        return self.session.get(f"{BASE}/draft/{draft_id}/traded_picks").json()
+        return self._get(f"/draft/{draft_id}/traded_picks")
 
     # -------------------------
     # PLAYERS ENDPOINTS
@@ -387,7 +550,7 @@ class SleeperAPI:
               ...
             }
         """
-        return self.session.get(f"{BASE}/players/{sport}").json()
+        return self._get(f"/players/{sport}")
 
     def get_trending_players(self, sport: str = "nfl", type_: str = "add", lookback_hours: int = 24):
         """
@@ -411,9 +574,7 @@ class SleeperAPI:
               ...
             ]
         """
-        return self.session.get(
-            f"{BASE}/players/{sport}/trending/{type_}?lookback_hours={lookback_hours}"
-        ).json()
+        return self._get(f"/players/{sport}/trending/{type_}?lookback_hours={lookback_hours}")
 
     # -------------------------
     # STATE & OTHER ENDPOINTS
@@ -440,7 +601,7 @@ class SleeperAPI:
               ...
             }
         """
-        return self.session.get(f"{BASE}/state/{sport}").json()
+        return self._get(f"/state/{sport}")
 
     def get_drafts_for_league(self, league_id: str) -> List[Dict[str, Any]]:
         """
@@ -463,7 +624,7 @@ class SleeperAPI:
               }
             ]
         """
-        return self.session.get(f"{BASE}/league/{league_id}/drafts").json()
+        return self._get(f"/league/{league_id}/drafts")
 
     def get_avatar_url(self, avatar_id: str) -> str:
         """
@@ -486,7 +647,8 @@ class SleeperAPI:
     # ======================================================================
     def get_player_name_from_id(self, player_id: str) -> Optional[str]:
         """
-        Get a player's full name from their ID using the cache.
+        Get a player's full name from their ID using the compact player index if built,
+        otherwise the players table (loaded on first call).
 
         Args:
             player_id (str): The ID of the player.
@@ -498,11 +660,98 @@ class SleeperAPI:
             >>> api.get_player_name_from_id("4046")
             "Patrick Mahomes"
         """
-        player = self._cached_players.get(player_id)
+        if self._player_index is not None:
+            return self._player_index.name(player_id)
+        player = self.players().get(player_id)
         if player:
             return player.get("full_name")
         return None
 
+    def refresh_player_index(self, path: Optional[str] = None, fields: Sequence[str] = PLAYER_FIELDS,
+                             sport: str = "nfl", delta: bool = True) -> int:
+        """
+        Stream the /players dump straight into the compact player index, keeping only the given fields.
+
+        The response is parsed incrementally (see player_index.iter_players), so the full object graph
+        is never built and peak memory stays bounded. If the index already exists and delta is True,
+        only changed players are rewritten and the changes are appended to its change log
+        (see player_index.update_player_index); fields is then ignored in favour of the stored ones.
+        The index is used for lookups from then on.
+
+        Args:
+            path (str, optional): Index file to write (default is the client's index path).
+            fields (Sequence[str], optional): Player fields to keep on a full rebuild (default is PLAYER_FIELDS).
+            sport (str, optional): The sport (default is "nfl").
+            delta (bool, optional): Update an existing index in place (default is True).
+
+        Returns:
+            int: The number of players written (only the changed ones for a delta refresh).
+
+        Example:
+            >>> api.refresh_player_index(fields=("full_name", "position", "team", "age", "status"))
+            11402
+        """
+        path = path or self.player_index_path or DEFAULT_PLAYER_INDEX_PATH
+        request_path = f"/players/{sport}"
+        start = time.perf_counter()
+        response, retries = self._request(request_path, stream=True)
+        received = 0
+
+        def chunks():
+            nonlocal received
+            for chunk in response.iter_content(CHUNK_SIZE):
+                received += len(chunk)
+                yield chunk
+
+        delta = delta and os.path.exists(path)
+        try:
+            if delta:
+                count = len({change["player_id"] for change in update_player_index(iter_players(chunks()), path)})
+            else:
+                count = build_player_index(iter_players(chunks()), path, fields)
+        finally:
+            response.close()
+        self.metrics.record(request_path, time.perf_counter() - start, received, cache_hit=False, retries=retries)
+        if self._player_index is not None and self._player_index.path == path and delta:
+            # updated in place; the open index already sees the new rows
+            return count
+        if self._player_index is not None:
+            self._player_index.close()
+        self._player_index = PlayerIndex(path)
+        self.player_index_path = path
+        return count
+
+    def get_player_info(self, player_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a player's name, position, team and age from their ID.
+
+        Args:
+            player_id (str): The ID of the player.
+
+        Returns:
+            Optional[Dict[str, Any]]: The player's compact record, or None if not found.
+
+        Example:
+            >>> api.get_player_info("4046")
+            {"player_id": "4046", "full_name": "Patrick Mahomes", "position": "QB", "team": "KC", "age": 30}
+        """
+        if self._player_index is not None:
+            return self._player_index.get(player_id)
+        player = self.players().get(player_id)
+        if not player:
+            return None
+        return dict({"player_id": player_id}, **{field: player.get(field) for field in PLAYER_FIELDS})
+
+    def player_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the compact record (see get_player_info) of every player.
+        """
+        if self._player_index is not None:
+            yield from self._player_index.records()
+            return
+        for player_id, player in self.players().items():
+            yield dict({"player_id": player_id}, **{field: player.get(field) for field in PLAYER_FIELDS})
+
     def get_all_previous_league_ids(self, current_id: str) -> Dict[str, str]:
         """
         Get all previous league IDs for a league, tracing back through history.
@@ -521,15 +770,7 @@ class SleeperAPI:
               "2023": "1002944074959167488"
             }
         """
-        league = self.get_league(current_id)
-        season = league.get("season")
-        all_ids = {season: current_id}
-        while league.get("previous_league_id"):
-            previous_id = league.get("previous_league_id")
-            league = self.get_league(previous_id)
-            season = league.get("season")
-            all_ids[season] = previous_id
-        return all_ids
+        return self.get_league_history(current_id).league_ids()
 
     def get_all_previous_drafts(self, current_league_id):
         """
@@ -549,16 +790,31 @@ class SleeperAPI:
               ...
             }
         """
-        league = self.get_league(current_league_id)
-        season = league.get("season")
-        drafts = {season: [d['draft_id'] for d in self.get_drafts_for_league(current_league_id)]}
-        while league.get("previous_league_id"):
-            previous_id = league.get("previous_league_id")
-            league = self.get_league(previous_id)
-            season = league.get("season")
-            draft_list = [d["draft_id"] for d in self.get_drafts_for_league(previous_id)]
-            drafts[season] = draft_list
-        return drafts
+        return self.get_league_history(current_league_id).all_draft_ids()
+
+    def get_league_history(self, current_league_id: str, path: Optional[str] = None) -> LeagueHistory:
+        """
+        Get every season of a league from a single walk of the previous_league_id chain, cached per client.
+
+        Args:
+            current_league_id (str): The current league ID.
+            path (str, optional): JSON file to persist the history in, so later runs skip the walk
+                (see LeagueHistory.load_or_build).
+
+        Returns:
+            LeagueHistory: League objects, league IDs, drafts and settings per season.
+
+        Example:
+            >>> history = api.get_league_history("1182986456149786624", "league_history_1182986456149786624.json")
+            >>> history.draft_ids_by_season()
+            {"2025": "1182986456149786625", "2024": "1080545431282696193", "2023": "1002944076578250752"}
+        """
+        def build() -> LeagueHistory:
+            if path:
+                return LeagueHistory.load_or_build(self, current_league_id, path)
+            return LeagueHistory.build(self, current_league_id)
+
+        return self._build_once("history", self._league_histories, current_league_id, build)
 
     def get_player_drafted_with_pick(self, draft_id: str, draft_pick: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -581,35 +837,67 @@ class SleeperAPI:
               "season": "2025"
             }
         """
-        draft_picks = self.get_draft_picks(draft_id)
-        roster_id = draft_pick.get("roster_id")
-        pick_round = draft_pick.get("round")
-        draft = self.get_draft(draft_id)
-        if not draft:
-            return {"id": "", "round": pick_round, "slot": "", "season": draft_pick.get("season")}  # John Elway
-        slots = draft.get("slot_to_roster_id", {})
-        # get draft slot from the roster id
-        draft_slot = None
-        for slot, r_id in slots.items():
-            if str(r_id) == str(roster_id):
-                draft_slot = slot
-                break
-        for pick in draft_picks:
-            if str(pick.get("draft_slot")) == str(draft_slot) and str(pick.get("round")) == str(pick_round):
-                player_id = pick.get("player_id")
-                player_name = self.get_player_name_from_id(player_id)
-                return {"id": player_id, "name": player_name, "round": pick_round, "slot": draft_slot, "season": draft_pick.get("season")}
-        return {"id": "4759", "round": "1", "slot": "1"}  # John Elway
-
-    def get_all_trades_in_leagues(self, league_ids: List[str]) -> List[Dict[str, Any]]:
+        return self.get_draft_index(draft_id).resolve(draft_pick, self.get_player_name_from_id)
+
+    def get_players_drafted_with_picks(self, draft_id: str, draft_picks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Batch version of get_player_drafted_with_pick for several picks from the same draft.
+
+        Args:
+            draft_id (str): The ID of the draft.
+            draft_picks (List[Dict[str, Any]]): The pick dictionaries containing round, roster_id, season.
+
+        Returns:
+            List[Dict[str, Any]]: One player dictionary per pick, in the same order.
+
+        Example:
+            >>> api.get_players_drafted_with_picks("1182986456149786625", [{"round": 1, "roster_id": 3, "season": "2025"}, ...])
+            [
+              {"id": "12527", "name": "Ashton Jeanty", "round": 1, "slot": "1", "season": "2025"},
+              ...
+            ]
+        """
+        index = self.get_draft_index(draft_id)
+        return [index.resolve(draft_pick, self.get_player_name_from_id) for draft_pick in draft_picks]
+
+    def get_draft_index(self, draft_id: Optional[str]) -> DraftIndex:
+        """
+        Get the pick index for a draft, building it (one draft and one picks fetch) on first use.
+
+        Args:
+            draft_id (str): The ID of the draft, or None for a season without a draft yet.
+
+        Returns:
+            DraftIndex: The cached index for the draft.
+
+        Example:
+            >>> api.get_draft_index("1182986456149786625").slot_for(3)
+            "1"
+        """
+        return self._build_once("draft", self._draft_indexes, draft_id, lambda: DraftIndex.build(self, draft_id))
+
+    def invalidate_draft_index(self, draft_id: Optional[str] = None) -> None:
+        """
+        Drop the cached index for a draft (e.g. while it is still in progress), or for all drafts if draft_id is None.
+
+        Args:
+            draft_id (str, optional): The ID of the draft.
+        """
+        if draft_id is None:
+            self._draft_indexes.clear()
+        else:
+            self._draft_indexes.pop(draft_id, None)
+
+    def get_all_trades_in_leagues(self, league_ids: List[str], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get all trades across multiple leagues (or seasons of a league).
 
         Args:
             league_ids (List[str]): A list of league IDs.
+            max_workers (int, optional): Concurrent requests (default is the client's max_workers).
 
         Returns:
-            List[Dict[str, Any]]: A list of trade transaction dictionaries.
+            List[Dict[str, Any]]: A list of trade transaction dictionaries, in (league, week) order.
 
         Example:
             >>> api.get_all_trades_in_leagues(["1182986456149786624"])
@@ -623,13 +911,39 @@ class SleeperAPI:
             ]
         """
         all_trades = []
+        transactions = self.collect_transactions(league_ids, range(1, 25), max_workers=max_workers)
         for league_id in league_ids:
-            for i in range(1, 25):
-                trades = self.get_league_transactions(league_id, week=i)
-                trade_list = [trade for trade in trades if trade['type'] == 'trade']
-                all_trades.extend(trade_list)
+            all_trades.extend(trade for trade in transactions[league_id] if trade['type'] == 'trade')
         return all_trades
 
+    def collect_transactions(self, league_ids: List[str], weeks: Iterable[int],
+                             max_workers: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch the transactions of every (league, week) pair on a bounded thread pool.
+
+        Args:
+            league_ids (List[str]): A list of league IDs.
+            weeks (Iterable[int]): The weeks to fetch for each league (e.g. range(1, 18)).
+            max_workers (int, optional): Concurrent requests (default is the client's max_workers).
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: League ID to its transactions, in league then week order.
+
+        Example:
+            >>> api.collect_transactions(["1182986456149786624"], range(1, 18), max_workers=4)
+            {
+              "1182986456149786624": [{"transaction_id": "...", "type": "trade", ...}, ...]
+            }
+        """
+        pairs = [(league_id, week) for league_id in league_ids for week in weeks]
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            # map() yields results in submission order, so output order does not depend on timing
+            pages = executor.map(lambda pair: self.get_league_transactions(pair[0], week=pair[1]), pairs)
+            transactions = {league_id: [] for league_id in league_ids}
+            for (league_id, _), page in zip(pairs, pages):
+                transactions[league_id].extend(page or [])
+        return transactions
+
     def get_roster_name_by_roster_id(self, league_id: str, roster_id: str) -> Optional[str]:
         """
         Get the display name of the owner of a roster.
@@ -645,12 +959,35 @@ class SleeperAPI:
             >>> api.get_roster_name_by_roster_id("1182986456149786624", "1")
             "ZFox3"
         """
-        rosters = self.get_league_rosters(league_id)
-        for roster in rosters:
-            if str(roster.get("roster_id")) == str(roster_id):
-                owner_id = roster.get("owner_id")
-                return self.user_from_id(owner_id, league_id).get("display_name")
-        return None
+        return self.get_league_index(league_id).display_name(roster_id)
+
+    def get_league_index(self, league_id: str) -> LeagueIndex:
+        """
+        Get the roster/owner index for a league, building it (one rosters and one users fetch) on first use.
+
+        Args:
+            league_id (str): The ID of the league.
+
+        Returns:
+            LeagueIndex: The cached index for the league.
+
+        Example:
+            >>> api.get_league_index("1182986456149786624").display_name(1)
+            "ZFox3"
+        """
+        return self._build_once("league", self._league_indexes, league_id, lambda: LeagueIndex.build(self, league_id))
+
+    def invalidate_league_index(self, league_id: Optional[str] = None) -> None:
+        """
+        Drop the cached index for a league (e.g. after an owner change), or for all leagues if league_id is None.
+
+        Args:
+            league_id (str, optional): The ID of the league.
+        """
+        if league_id is None:
+            self._league_indexes.clear()
+        else:
+            self._league_indexes.pop(league_id, None)
 
     def get_trade_info(self, trade: Dict[str, Any], current_league_id: str, drafts: Dict[str, str]) -> dict[Any, Any]:
         """
@@ -675,15 +1012,82 @@ class SleeperAPI:
               "time_created": 1754859515981
             }
         """
+        return self._build_trade_info(
+            trade,
+            lambda pick: self.get_player_drafted_with_pick(draft_id=drafts.get(pick.get("season")), draft_pick=pick),
+            self.get_league_index(current_league_id).display_name,
+        )
+
+    def resolve_trades(self, trades: List[Dict[str, Any]], league_id: str, drafts: Dict[str, str],
+                       max_workers: Optional[int] = None) -> List[dict[Any, Any]]:
+        """
+        Batch version of get_trade_info: resolve many trades with one fetch per resource.
+
+        All trades are scanned first to collect the drafts and players involved. The league's rosters
+        and users and every draft and its picks are then fetched exactly once, concurrently, and each
+        player name is looked up once. Finally every trade is resolved from memory, so the number of
+        requests depends on the number of leagues and drafts, not trades.
+
+        Args:
+            trades (List[Dict[str, Any]]): The trade transaction dictionaries.
+            league_id (str): The current league ID (for roster names).
+            drafts (Dict[str, str]): A mapping of season to draft ID (to resolve picks).
+            max_workers (int, optional): Concurrent requests (default is the client's max_workers).
+
+        Returns:
+            List[dict[Any, Any]]: One get_trade_info result per trade, in the same order.
+
+        Example:
+            >>> api.resolve_trades(all_trades, "1182986456149786624", drafts_dict)
+            [
+              {"paswordistaco22": {"additions": [...], "subtractions": [...]}, "ZFox3": {...}, "time_created": 1754859515981},
+              ...
+            ]
+        """
+        draft_ids = {drafts.get(pick.get("season")) for trade in trades for pick in trade.get("draft_picks") or []}
+        draft_ids = [draft_id for draft_id in draft_ids if draft_id not in self._draft_indexes]
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            if self._player_index is None:
+                executor.submit(self.players)
+            # through get_draft_index / _build_once, so a draft another thread is building is not fetched twice
+            built = [executor.submit(self.get_draft_index, draft_id) for draft_id in draft_ids if draft_id is not None]
+
+            def build_league_index() -> LeagueIndex:
+                rosters = executor.submit(self.get_league_rosters, league_id)
+                users = executor.submit(self.get_league_users, league_id)
+                return LeagueIndex(league_id, rosters.result(), users.result())
+
+            league_index = self._build_once("league", self._league_indexes, league_id, build_league_index)
+            for future in built:
+                future.result()
+        names: Dict[str, Optional[str]] = {}
+
+        def player_name(player_id: str) -> Optional[str]:
+            if player_id not in names:
+                names[player_id] = self.get_player_name_from_id(player_id)
+            return names[player_id]
+
+        return [
+            self._build_trade_info(
+                trade,
+                lambda pick: self.get_draft_index(drafts.get(pick.get("season"))).resolve(pick, player_name),
+                league_index.display_name,
+                player_name,
+            )
+            for trade in trades
+        ]
+
+    def _build_trade_info(self, trade: Dict[str, Any], drafted_with_pick: Callable[[Dict[str, Any]], Dict[str, Any]],
+                          roster_name: Callable[[Any], Optional[str]],
+                          player_name: Optional[Callable[[str], Optional[str]]] = None) -> dict[Any, Any]:
+        # shared by get_trade_info, resolve_trades and AsyncSleeperAPI.get_trade_info, which prefetch everything first
+        player_name = player_name or self.get_player_name_from_id
         roster_ids = trade.get("roster_ids", [])
         trade_info = {}
         trade_changes = {k: {"additions": [], "subtractions": []} for k in roster_ids}
-        draft_picks_info = trade.get("draft_picks", [])
+        draft_picks_info = trade.get("draft_picks") or []
         for pick in draft_picks_info:
-            drafted_player = self.get_player_drafted_with_pick(
-                draft_id=drafts.get(pick.get("season")),
-                draft_pick=pick
-            )
+            drafted_player = drafted_with_pick(pick)
             new_owner = pick.get("owner_id")
             old_owner = pick.get("previous_owner_id")
             trade_changes[new_owner]["additions"].append(drafted_player)
@@ -692,15 +1096,14 @@ class SleeperAPI:
         if adds:
             for player_id in adds.keys():
                 new_owner = adds[player_id]
-                trade_changes[new_owner]["additions"].append({"id": player_id, "name": self.get_player_name_from_id(player_id)})
+                trade_changes[new_owner]["additions"].append({"id": player_id, "name": player_name(player_id)})
         drops = trade.get("drops", {})
         if drops:
             for player_id in drops.keys():
                 old_owner = drops[player_id]
-                trade_changes[old_owner]["subtractions"].append({"id": player_id, "name": self.get_player_name_from_id(player_id)})
+                trade_changes[old_owner]["subtractions"].append({"id": player_id, "name": player_name(player_id)})
         for roster_id, changes in trade_changes.items():
-            roster_name = self.get_roster_name_by_roster_id(current_league_id, roster_id)
-            trade_info[roster_name] = changes
+            trade_info[roster_name(roster_id)] = changes
         trade_info["time_created"] = trade.get("created")
         return trade_info
 
@@ -726,11 +1129,7 @@ class SleeperAPI:
               ...
             }
         """
-        users = self.get_league_users(league_id)
-        for user in users:
-            if user.get("user_id") == user_id:
-                return user
-        return {}
+        return self.get_league_index(league_id).user(user_id)
 
 
 # Example of basic usage:
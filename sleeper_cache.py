@@ -0,0 +1,197 @@
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, List, Optional, Pattern, Tuple
+
+import sleeper_codec
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# First matching rule wins. A TTL of None means the entry never expires.
+DEFAULT_TTLS: List[Tuple[Pattern, Optional[int]]] = [
+    (re.compile(r"^/state/"), 5 * MINUTE),
+    (re.compile(r"^/players/[^/]+$"), DAY),
+    (re.compile(r"^/players/[^/]+/trending/"), HOUR),
+    (re.compile(r"^/draft/[^/]+/picks$"), HOUR),
+    (re.compile(r"^/draft/"), HOUR),
+    (re.compile(r"^/league/[^/]+/transactions/"), 15 * MINUTE),
+    (re.compile(r"^/league/"), HOUR),
+    (re.compile(r"^/user/"), HOUR),
+]
+
+# Leagues and drafts whose status is "complete" never change again, so once we
+# see one every response under its path is kept forever.
+_FREEZABLE = re.compile(r"^/(league|draft)/([^/]+)$")
+
+
+class ResponseCache:
+    """
+    Disk-backed cache of raw Sleeper API responses, keyed by request path.
+
+    Entries are stored in a SQLite file with a per-endpoint TTL (see DEFAULT_TTLS).
+    Completed leagues and drafts, and everything under them, never expire. When the
+    stored bodies exceed max_bytes the least recently used entries are evicted.
+
+    Args:
+        path (str): Path of the SQLite file (":memory:" for a throwaway cache).
+        max_bytes (int, optional): Upper bound on the total size of stored bodies.
+        ttls (List[Tuple[Pattern, Optional[int]]], optional): Path rules overriding DEFAULT_TTLS.
+        bypass (bool, optional): If True, reads always miss but responses are still stored.
+
+    Example:
+        >>> api = SleeperAPI(cache=ResponseCache("sleeper_cache.sqlite"))
+        >>> api.cache.bypass = True  # force a refresh for this run
+    """
+
+    def __init__(self, path: str = "sleeper_cache.sqlite", max_bytes: int = 256 * 1024 * 1024,
+                 ttls: Optional[List[Tuple[Pattern, Optional[int]]]] = None, bypass: bool = False):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = ttls if ttls is not None else DEFAULT_TTLS
+        self.bypass = bypass
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                path TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+            CREATE TABLE IF NOT EXISTS frozen (
+                prefix TEXT PRIMARY KEY
+            );
+            """
+        )
+        self._frozen = {row[0] for row in self._conn.execute("SELECT prefix FROM frozen")}
+        self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def ttl_for(self, path: str) -> Optional[int]:
+        """
+        Get the TTL in seconds for a path, or None if it never expires.
+
+        Example:
+            >>> cache.ttl_for("/state/nfl")
+            300
+        """
+        match = _FREEZABLE.match(path) or re.match(r"^/(league|draft)/([^/]+)/", path)
+        if match and f"/{match.group(1)}/{match.group(2)}" in self._frozen:
+            return None
+        for pattern, ttl in self.ttls:
+            if pattern.search(path):
+                return ttl
+        return HOUR
+
+    def get(self, path: str) -> Optional[bytes]:
+        """
+        Get the cached body for a path, or None on a miss, an expired entry or bypass.
+        """
+        if self.bypass:
+            return None
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires_at FROM responses WHERE path = ?", (path,)
+            ).fetchone()
+            if row is None:
+                return None
+            body, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._delete(path)
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE path = ?", (now, path))
+            self._conn.commit()
+        return body
+
+    def set(self, path: str, body: bytes, payload: Any = None) -> None:
+        """
+        Store a response body for a path.
+
+        Args:
+            path (str): The request path relative to BASE (e.g. "/league/123").
+            body (bytes): The raw response body.
+            payload (Any, optional): The decoded body, used to detect completed leagues/drafts
+                (decoded here when needed if not given).
+        """
+        match = _FREEZABLE.match(path)
+        if match and payload is None:
+            try:
+                payload = sleeper_codec.loads(body)
+            except sleeper_codec.DecodeError:
+                payload = None
+        if match and isinstance(payload, dict) and payload.get("status") == "complete":
+            self.freeze(path)
+        ttl = self.ttl_for(path)
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        with self._lock:
+            self._delete(path)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (path, body, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (path, body, len(body), expires_at, now),
+            )
+            self._total += len(body)
+            if self._total > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def freeze(self, prefix: str) -> None:
+        """
+        Mark a league or draft path (e.g. "/league/123") as complete so it and its sub-paths never expire.
+        """
+        with self._lock:
+            self._frozen.add(prefix)
+            self._conn.execute("INSERT OR IGNORE INTO frozen (prefix) VALUES (?)", (prefix,))
+            self._conn.execute(
+                "UPDATE responses SET expires_at = NULL WHERE path = ? OR path LIKE ?",
+                (prefix, prefix + "/%"),
+            )
+            self._conn.commit()
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Drop one cached path (and its sub-paths), or everything if path is None.
+        """
+        with self._lock:
+            if path is None:
+                self._conn.execute("DELETE FROM responses")
+            else:
+                self._conn.execute("DELETE FROM responses WHERE path = ? OR path LIKE ?", (path, path + "/%"))
+            self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            self._conn.commit()
+
+    def size(self) -> int:
+        """
+        Get the total size in bytes of all stored bodies.
+        """
+        return self._total
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _delete(self, path: str) -> None:
+        # Caller holds the lock.
+        row = self._conn.execute("SELECT size FROM responses WHERE path = ?", (path,)).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM responses WHERE path = ?", (path,))
+            self._total -= row[0]
+
+    def _evict(self) -> None:
+        # Caller holds the lock. Drop expired entries first, then least recently used ones.
+        self._conn.execute("DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+        self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if self._total <= self.max_bytes:
+            return
+        for path, size in self._conn.execute("SELECT path, size FROM responses ORDER BY accessed_at").fetchall():
+            self._conn.execute("DELETE FROM responses WHERE path = ?", (path,))
+            self._total -= size
+            if self._total <= self.max_bytes:
+                break
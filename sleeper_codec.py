@@ -0,0 +1,108 @@
+import json
+import os
+from typing import Any, Optional, Union
+
+# JSON codec shared by the client and the pipeline scripts. orjson or msgspec are used when
+# installed (several times faster than the json module on large responses and outputs), with the
+# stdlib as the fallback. Force one with SLEEPER_JSON_CODEC=orjson|msgspec|json.
+
+try:
+    import orjson
+except ImportError:  # optional
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional
+    msgspec = None
+
+
+def _pick_backend(preferred: Optional[str]) -> str:
+    available = [name for name, module in (("orjson", orjson), ("msgspec", msgspec)) if module is not None] + ["json"]
+    if preferred:
+        if preferred not in available:
+            raise ValueError(f"JSON codec {preferred!r} is not available (available: {', '.join(available)})")
+        return preferred
+    return available[0]
+
+
+BACKEND = _pick_backend(os.environ.get("SLEEPER_JSON_CODEC"))
+
+# exception raised for malformed input, whichever backend is active
+if BACKEND == "msgspec":
+    DecodeError = (json.JSONDecodeError, msgspec.DecodeError)
+else:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    DecodeError = (json.JSONDecodeError,)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Decode JSON from bytes or str.
+
+    Example:
+        >>> loads(b'{"league_id": "1182986456149786624"}')
+        {"league_id": "1182986456149786624"}
+    """
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    if BACKEND == "msgspec":
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode obj as UTF-8 JSON bytes.
+
+    Args:
+        obj (Any): The value to encode.
+        indent (bool, optional): Pretty-print with a 2-space indent, like json.dump(..., indent=2) (default is False).
+    """
+    if BACKEND == "orjson":
+        # numpy values (see the analytics and snapshot code) and int keys are encoded like the stdlib would
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if BACKEND == "msgspec":
+        data = msgspec.json.encode(obj)
+        return msgspec.json.format(data, indent=2) if indent else data
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def json_key(key: Any) -> str:
+    """
+    The string a dict key becomes when encoded, e.g. "null" for None (an ownerless roster's team).
+    """
+    if isinstance(key, str):
+        return key
+    return json.dumps(key)
+
+
+def load(path: str) -> Any:
+    """
+    Read and decode a JSON file.
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump(obj: Any, path: str, indent: bool = True, prefix: str = "", suffix: str = "") -> None:
+    """
+    Encode obj and write it to path as UTF-8, optionally wrapped in prefix/suffix text.
+
+    Args:
+        obj (Any): The value to encode.
+        path (str): The output file.
+        indent (bool, optional): Pretty-print with a 2-space indent (default is True).
+        prefix (str, optional): Text written before the JSON, e.g. "const TRADES_DATA = ".
+        suffix (str, optional): Text written after the JSON, e.g. ";".
+
+    Example:
+        >>> dump(trade_infos, "docs/data.js", prefix="const TRADES_DATA = ", suffix=";")
+    """
+    with open(path, "wb") as f:
+        f.write(prefix.encode("utf-8") + dumps(obj, indent=indent) + suffix.encode("utf-8"))
@@ -0,0 +1,236 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from sleeper_api_wrapper import SleeperAPI
+
+
+class LeagueIndex:
+    """
+    In-memory roster/owner lookups for one league, built from a single rosters fetch and a
+    single users fetch. Roster IDs are normalized to str once here so lookups are plain dict hits.
+
+    Args:
+        league_id (str): The ID of the league.
+        rosters (List[Dict[str, Any]]): The league's rosters (SleeperAPI.get_league_rosters).
+        users (List[Dict[str, Any]]): The league's users (SleeperAPI.get_league_users).
+
+    Example:
+        >>> index = api.get_league_index("1182986456149786624")
+        >>> index.display_name(1)
+        "ZFox3"
+    """
+
+    def __init__(self, league_id: str, rosters: Optional[List[Dict[str, Any]]], users: Optional[List[Dict[str, Any]]]):
+        self.league_id = league_id
+        self.owner_by_roster: Dict[str, Optional[str]] = {
+            str(roster.get("roster_id")): roster.get("owner_id") for roster in rosters or []
+        }
+        self.users_by_id: Dict[str, Dict[str, Any]] = {user.get("user_id"): user for user in users or []}
+
+    @classmethod
+    def build(cls, api: "SleeperAPI", league_id: str) -> "LeagueIndex":
+        """
+        Fetch a league's rosters and users and index them.
+        """
+        return cls(league_id, api.get_league_rosters(league_id), api.get_league_users(league_id))
+
+    def owner_id(self, roster_id: Any) -> Optional[str]:
+        """
+        Get the owner user_id of a roster, or None.
+        """
+        return self.owner_by_roster.get(str(roster_id))
+
+    def user(self, user_id: Optional[str]) -> Dict[str, Any]:
+        """
+        Get a user by user_id, or {} if they are not in the league.
+        """
+        return self.users_by_id.get(user_id, {})
+
+    def roster_user(self, roster_id: Any) -> Dict[str, Any]:
+        """
+        Get the user owning a roster, or {}.
+        """
+        return self.user(self.owner_id(roster_id))
+
+    def display_name(self, roster_id: Any) -> Optional[str]:
+        """
+        Get the display name of the owner of a roster, or None.
+        """
+        return self.roster_user(roster_id).get("display_name")
+
+    def avatar(self, roster_id: Any) -> Optional[str]:
+        """
+        Get the avatar ID of the owner of a roster, or None.
+        """
+        return self.roster_user(roster_id).get("avatar")
+
+
+class DraftIndex:
+    """
+    In-memory pick lookups for one draft, built from a single draft fetch and a single picks fetch.
+    Holds the inverted slot_to_roster_id map (roster_id -> slot) and a (round, slot) -> pick dict,
+    so resolving a traded pick is two dict hits.
+
+    Args:
+        draft_id (str): The ID of the draft.
+        draft (Dict[str, Any]): The draft (SleeperAPI.get_draft), or None if it does not exist yet.
+        picks (List[Dict[str, Any]]): The draft's picks (SleeperAPI.get_draft_picks).
+
+    Example:
+        >>> index = api.get_draft_index("1182986456149786625")
+        >>> index.pick_for(round_=1, slot="1")["player_id"]
+        "12527"
+    """
+
+    def __init__(self, draft_id: Optional[str], draft: Optional[Dict[str, Any]], picks: Optional[List[Dict[str, Any]]]):
+        self.draft_id = draft_id
+        self.draft = draft
+        # keep the first slot / pick on duplicates, like the linear scans this replaces
+        self.slot_by_roster: Dict[str, str] = {}
+        for slot, roster_id in ((draft or {}).get("slot_to_roster_id") or {}).items():
+            self.slot_by_roster.setdefault(str(roster_id), slot)
+        self.pick_by_round_slot: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for pick in picks or []:
+            self.pick_by_round_slot.setdefault((str(pick.get("round")), str(pick.get("draft_slot"))), pick)
+
+    @classmethod
+    def build(cls, api: "SleeperAPI", draft_id: Optional[str]) -> "DraftIndex":
+        """
+        Fetch a draft and its picks and index them. A missing draft_id (a future season) makes no requests.
+        """
+        if draft_id is None:
+            return cls(None, None, [])
+        return cls(draft_id, api.get_draft(draft_id), api.get_draft_picks(draft_id))
+
+    def slot_for(self, roster_id: Any) -> Optional[str]:
+        """
+        Get the draft slot of a roster, or None.
+        """
+        return self.slot_by_roster.get(str(roster_id))
+
+    def pick_for(self, round_: Any, slot: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get the pick made in a round from a slot, or None.
+        """
+        return self.pick_by_round_slot.get((str(round_), str(slot)))
+
+    def resolve(self, draft_pick: Dict[str, Any], player_name: Callable[[str], Optional[str]]) -> Dict[str, Any]:
+        """
+        Resolve a traded pick (round, roster_id, season) to the player drafted with it.
+        See SleeperAPI.get_player_drafted_with_pick for the returned shape.
+        """
+        pick_round = draft_pick.get("round")
+        if not self.draft:
+            return {"id": "", "round": pick_round, "slot": "", "season": draft_pick.get("season")}  # John Elway
+        draft_slot = self.slot_for(draft_pick.get("roster_id"))
+        pick = self.pick_for(pick_round, draft_slot)
+        if pick is None:
+            return {"id": "4759", "round": "1", "slot": "1"}  # John Elway
+        player_id = pick.get("player_id")
+        return {"id": player_id, "name": player_name(player_id), "round": pick_round, "slot": draft_slot, "season": draft_pick.get("season")}
+
+
+class LeagueHistory:
+    """
+    Every season of a league, collected in one walk of the previous_league_id chain: the league
+    objects, season -> league_id, season -> drafts and per-season settings. It can be saved to
+    disk so later runs skip the walk (see load_or_build).
+
+    Args:
+        current_league_id (str): The ID of the most recent league in the chain.
+        leagues (Dict[str, Dict[str, Any]]): Season to league object, newest first.
+        drafts (Dict[str, List[Dict[str, Any]]]): Season to the league's drafts.
+
+    Example:
+        >>> history = api.get_league_history("1182986456149786624")
+        >>> history.league_ids()
+        {"2025": "1182986456149786624", "2024": "1080545431282696192", "2023": "1002944074959167488"}
+        >>> history.draft_ids_by_season()
+        {"2025": "1182986456149786625", "2024": "1080545431282696193", "2023": "1002944076578250752"}
+    """
+
+    def __init__(self, current_league_id: str, leagues: Dict[str, Dict[str, Any]], drafts: Dict[str, List[Dict[str, Any]]]):
+        self.current_league_id = current_league_id
+        self.leagues = leagues
+        self.drafts = drafts
+
+    @classmethod
+    def build(cls, api: "SleeperAPI", current_league_id: str, max_workers: Optional[int] = None) -> "LeagueHistory":
+        """
+        Walk the previous_league_id chain once. The chain itself has to be followed one league at a
+        time, but each season's drafts are requested on a thread pool as soon as its league ID is known.
+        """
+        leagues = {}
+        draft_futures = []
+        with ThreadPoolExecutor(max_workers=max_workers or api.max_workers) as executor:
+            league_id = current_league_id
+            while league_id:
+                draft_futures.append(executor.submit(api.get_drafts_for_league, league_id))
+                league = api.get_league(league_id)
+                leagues[league.get("season")] = league
+                league_id = league.get("previous_league_id")
+            drafts = {season: future.result() or [] for season, future in zip(leagues, draft_futures)}
+        return cls(current_league_id, leagues, drafts)
+
+    @classmethod
+    def load(cls, path: str) -> "LeagueHistory":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["current_league_id"], data["leagues"], data["drafts"])
+
+    def save(self, path: str) -> None:
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"current_league_id": self.current_league_id, "leagues": self.leagues, "drafts": self.drafts}, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load_or_build(cls, api: "SleeperAPI", current_league_id: str, path: str,
+                      max_workers: Optional[int] = None) -> "LeagueHistory":
+        """
+        Load a saved history for this league if there is one, otherwise walk the chain and save it.
+
+        Completed seasons never change, so only seasons that are not complete yet (normally just the
+        current one) are refetched from a saved history: one league and one drafts request each.
+        """
+        if not os.path.exists(path):
+            history = cls.build(api, current_league_id, max_workers)
+            history.save(path)
+            return history
+        history = cls.load(path)
+        if history.current_league_id != current_league_id:
+            history = cls.build(api, current_league_id, max_workers)
+        else:
+            for season, league in list(history.leagues.items()):
+                if league.get("status") != "complete":
+                    history.leagues[season] = api.get_league(league["league_id"])
+                    history.drafts[season] = api.get_drafts_for_league(league["league_id"]) or []
+        history.save(path)
+        return history
+
+    def league_ids(self) -> Dict[str, str]:
+        """
+        Season to league ID, newest first (same shape as SleeperAPI.get_all_previous_league_ids).
+        """
+        return {season: league.get("league_id") for season, league in self.leagues.items()}
+
+    def all_draft_ids(self) -> Dict[str, List[str]]:
+        """
+        Season to every draft ID of that season (same shape as SleeperAPI.get_all_previous_drafts).
+        """
+        return {season: [draft["draft_id"] for draft in drafts] for season, drafts in self.drafts.items()}
+
+    def draft_ids_by_season(self) -> Dict[str, str]:
+        """
+        Season to the season's draft ID (the first one if there are several), as used by get_trade_info.
+        """
+        return {season: drafts[0]["draft_id"] for season, drafts in self.drafts.items() if drafts}
+
+    def settings(self, season: str) -> Dict[str, Any]:
+        """
+        Get a season's league settings (roster count, playoff weeks, ...), or {} for an unknown season.
+        """
+        return self.leagues.get(str(season), {}).get("settings") or {}
@@ -0,0 +1,184 @@
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# path segments following these are IDs and get folded into the endpoint name
+_ID_PARENTS = {"user", "league", "draft"}
+
+
+def endpoint_for(path: str) -> str:
+    """
+    Collapse a request path into its endpoint template.
+
+    Example:
+        >>> endpoint_for("/league/1182986456149786624/transactions/3")
+        "/league/{id}/transactions/{n}"
+    """
+    segments = path.split("?", 1)[0].split("/")
+    for i in range(1, len(segments)):
+        if segments[i - 1] in _ID_PARENTS:
+            segments[i] = "{id}"
+        elif segments[i].isdigit():
+            segments[i] = "{n}"
+    return "/".join(segments)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of already sorted samples (0.0 when there are none).
+    """
+    if not samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(samples)))
+    return samples[rank - 1]
+
+
+class RequestMetrics:
+    """
+    Per-endpoint request counters and latency samples for a SleeperAPI client. Safe to update
+    from several threads.
+
+    For every endpoint it tracks calls, bytes received, cache hits and misses (a miss is a call
+    that went to the network), retries, and p50/p95/p99 latency of network calls.
+
+    Args:
+        hook (Callable[[Dict[str, Any]], None], optional): Called after every request with an event
+            dict (endpoint, path, latency, bytes, cache_hit, retries), e.g. to forward to a metrics system.
+
+    Example:
+        >>> api = SleeperAPI()
+        >>> ...
+        >>> print(api.metrics.report())
+        >>> api.metrics.dump("metrics.json")
+    """
+
+    def __init__(self, hook: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.hook = hook
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, path: str, latency: float, size: int, cache_hit: bool, retries: int = 0) -> None:
+        """
+        Record one completed request.
+
+        Args:
+            path (str): The request path relative to BASE.
+            latency (float): Wall time in seconds, including retries.
+            size (int): Response body size in bytes.
+            cache_hit (bool): Whether the response came from the response cache.
+            retries (int, optional): How many times the request was retried.
+        """
+        endpoint = endpoint_for(path)
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = {"calls": 0, "bytes": 0, "cache_hits": 0, "cache_misses": 0, "retries": 0, "latencies": []}
+                self._endpoints[endpoint] = stats
+            stats["calls"] += 1
+            stats["bytes"] += size
+            stats["retries"] += retries
+            if cache_hit:
+                stats["cache_hits"] += 1
+            else:
+                stats["cache_misses"] += 1
+                stats["latencies"].append(latency)
+        if self.hook is not None:
+            self.hook({"endpoint": endpoint, "path": path, "latency": latency, "bytes": size,
+                       "cache_hit": cache_hit, "retries": retries})
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-endpoint totals, with latency percentiles in milliseconds.
+
+        Example:
+            >>> api.metrics.summary()["/league/{id}/rosters"]
+            {"calls": 5, "bytes": 61440, "cache_hits": 4, "cache_misses": 1, "retries": 0,
+             "p50_ms": 83.1, "p95_ms": 83.1, "p99_ms": 83.1}
+        """
+        with self._lock:
+            snapshot = {endpoint: dict(stats, latencies=sorted(stats["latencies"]))
+                        for endpoint, stats in self._endpoints.items()}
+        summary = {}
+        for endpoint, stats in sorted(snapshot.items()):
+            latencies = stats.pop("latencies")
+            for pct in (50, 95, 99):
+                stats[f"p{pct}_ms"] = round(percentile(latencies, pct) * 1000, 1)
+            summary[endpoint] = stats
+        return summary
+
+    def totals(self) -> Dict[str, int]:
+        """
+        Get calls, bytes, cache hits/misses and retries summed over all endpoints.
+        """
+        totals = {"calls": 0, "bytes": 0, "cache_hits": 0, "cache_misses": 0, "retries": 0}
+        for stats in self.summary().values():
+            for key in totals:
+                totals[key] += stats[key]
+        return totals
+
+    def report(self) -> str:
+        """
+        Format the summary as a plain-text table for the end of a run.
+        """
+        header = f"{'endpoint':<40} {'calls':>6} {'hits':>6} {'misses':>6} {'retries':>7} {'KB':>9} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8}"
+        lines = [header, "-" * len(header)]
+        for endpoint, stats in self.summary().items():
+            lines.append(
+                f"{endpoint:<40} {stats['calls']:>6} {stats['cache_hits']:>6} {stats['cache_misses']:>6} "
+                f"{stats['retries']:>7} {stats['bytes'] / 1024:>9.1f} {stats['p50_ms']:>8} {stats['p95_ms']:>8} {stats['p99_ms']:>8}"
+            )
+        totals = self.totals()
+        lines.append(f"{'total':<40} {totals['calls']:>6} {totals['cache_hits']:>6} {totals['cache_misses']:>6} "
+                     f"{totals['retries']:>7} {totals['bytes'] / 1024:>9.1f}")
+        return "\n".join(lines)
+
+    def dump(self, path: str) -> None:
+        """
+        Write the summary and totals to a JSON file.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"endpoints": self.summary(), "totals": self.totals()}, f, indent=2)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+
+class StageTimings:
+    """
+    Wall time per named pipeline stage, in the order the stages first ran.
+
+    Example:
+        >>> timings = StageTimings()
+        >>> with timings.stage("transactions"):
+        ...     trades = list_all_trades(api, league_ids)
+        >>> timings.stages
+        {"transactions": 1.84}
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def total(self) -> float:
+        return sum(self.stages.values())
+
+    def report(self) -> str:
+        """
+        Format the stage times as a plain-text table.
+        """
+        lines = [f"{'stage':<20} {'seconds':>9}"]
+        for name, seconds in self.stages.items():
+            lines.append(f"{name:<20} {seconds:>9.3f}")
+        lines.append(f"{'total':<20} {self.total():>9.3f}")
+        return "\n".join(lines)
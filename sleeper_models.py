@@ -0,0 +1,249 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+import sleeper_codec
+from sleeper_api_wrapper import SleeperAPI
+
+# Optional typed layer over the raw endpoint dicts. Models use __slots__, and IDs are normalized
+# once when parsing: user, league, draft, player and transaction IDs are str; roster IDs, rounds
+# and draft slots are int. Comparisons on them need no str(...) == str(...) afterwards.
+# LeagueIndex and DraftIndex (and so trade resolution) still work on the raw dicts.
+
+T = TypeVar("T")
+
+
+def _str(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _int(value: Any) -> Optional[int]:
+    return None if value is None or value == "" else int(value)
+
+
+@dataclass(slots=True)
+class User:
+    user_id: str
+    display_name: Optional[str] = None
+    avatar: Optional[str] = None
+    is_bot: bool = False
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "User":
+        return cls(
+            user_id=str(data["user_id"]),
+            display_name=data.get("display_name"),
+            avatar=data.get("avatar"),
+            is_bot=bool(data.get("is_bot")),
+            metadata=data.get("metadata") or {},
+        )
+
+
+@dataclass(slots=True)
+class Roster:
+    roster_id: int
+    owner_id: Optional[str] = None
+    players: Tuple[str, ...] = ()
+    starters: Tuple[str, ...] = ()
+    settings: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Roster":
+        return cls(
+            roster_id=int(data["roster_id"]),
+            owner_id=_str(data.get("owner_id")),
+            players=tuple(str(p) for p in data.get("players") or ()),
+            starters=tuple(str(p) for p in data.get("starters") or ()),
+            settings=data.get("settings") or {},
+        )
+
+
+@dataclass(slots=True)
+class League:
+    league_id: str
+    name: Optional[str] = None
+    season: Optional[str] = None
+    status: Optional[str] = None
+    total_rosters: Optional[int] = None
+    previous_league_id: Optional[str] = None
+    draft_id: Optional[str] = None
+    settings: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def is_complete(self) -> bool:
+        return self.status == "complete"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "League":
+        return cls(
+            league_id=str(data["league_id"]),
+            name=data.get("name"),
+            season=_str(data.get("season")),
+            status=data.get("status"),
+            total_rosters=_int(data.get("total_rosters")),
+            # Sleeper uses both null and "0" for "no previous league"
+            previous_league_id=_str(data.get("previous_league_id")) if data.get("previous_league_id") not in (None, "0") else None,
+            draft_id=_str(data.get("draft_id")),
+            settings=data.get("settings") or {},
+        )
+
+
+@dataclass(slots=True)
+class Draft:
+    draft_id: str
+    season: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+    league_id: Optional[str] = None
+    slot_to_roster_id: Dict[int, int] = field(default_factory=dict)
+    settings: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def roster_to_slot(self) -> Dict[int, int]:
+        return {roster_id: slot for slot, roster_id in self.slot_to_roster_id.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Draft":
+        return cls(
+            draft_id=str(data["draft_id"]),
+            season=_str(data.get("season")),
+            status=data.get("status"),
+            type=data.get("type"),
+            league_id=_str(data.get("league_id")),
+            slot_to_roster_id={int(slot): int(roster_id) for slot, roster_id in (data.get("slot_to_roster_id") or {}).items()
+                               if roster_id is not None},
+            settings=data.get("settings") or {},
+        )
+
+
+@dataclass(slots=True)
+class DraftPick:
+    round: int
+    draft_slot: int
+    pick_no: Optional[int] = None
+    player_id: Optional[str] = None
+    roster_id: Optional[int] = None
+    picked_by: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DraftPick":
+        return cls(
+            round=int(data["round"]),
+            draft_slot=int(data["draft_slot"]),
+            pick_no=_int(data.get("pick_no")),
+            player_id=_str(data.get("player_id")),
+            roster_id=_int(data.get("roster_id")),
+            picked_by=_str(data.get("picked_by")) or None,
+            metadata=data.get("metadata") or {},
+        )
+
+
+@dataclass(slots=True)
+class TradedPick:
+    """A future pick moving in a trade: roster_id is the original owner, owner_id the new one."""
+    season: str
+    round: int
+    roster_id: int
+    owner_id: int
+    previous_owner_id: int
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TradedPick":
+        return cls(
+            season=str(data["season"]),
+            round=int(data["round"]),
+            roster_id=int(data["roster_id"]),
+            owner_id=int(data["owner_id"]),
+            previous_owner_id=int(data["previous_owner_id"]),
+        )
+
+
+@dataclass(slots=True)
+class Transaction:
+    transaction_id: str
+    type: str
+    status: Optional[str] = None
+    created: Optional[int] = None
+    leg: Optional[int] = None
+    roster_ids: Tuple[int, ...] = ()
+    adds: Dict[str, int] = field(default_factory=dict)
+    drops: Dict[str, int] = field(default_factory=dict)
+    draft_picks: Tuple[TradedPick, ...] = ()
+
+    @property
+    def is_trade(self) -> bool:
+        return self.type == "trade"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Transaction":
+        return cls(
+            transaction_id=str(data["transaction_id"]),
+            type=data["type"],
+            status=data.get("status"),
+            created=_int(data.get("created")),
+            leg=_int(data.get("leg")),
+            roster_ids=tuple(int(r) for r in data.get("roster_ids") or ()),
+            adds={str(p): int(r) for p, r in (data.get("adds") or {}).items()},
+            drops={str(p): int(r) for p, r in (data.get("drops") or {}).items()},
+            draft_picks=tuple(TradedPick.from_dict(pick) for pick in data.get("draft_picks") or ()),
+        )
+
+
+def decode(body: Union[bytes, str], model: Type[T]) -> Optional[T]:
+    """
+    Decode a response body holding one object straight into a model (None for a null body).
+
+    Example:
+        >>> decode(b'{"league_id": "1182986456149786624", "season": "2025", ...}', League)
+        League(league_id="1182986456149786624", season="2025", ...)
+    """
+    data = sleeper_codec.loads(body)
+    return None if data is None else model.from_dict(data)
+
+
+def decode_list(body: Union[bytes, str], model: Type[T]) -> List[T]:
+    """
+    Decode a response body holding a list of objects straight into models (empty for a null body).
+    """
+    return [model.from_dict(item) for item in sleeper_codec.loads(body) or []]
+
+
+class TypedSleeperAPI:
+    """
+    Typed view of a SleeperAPI: the same endpoints, returning slotted models decoded straight
+    from the (possibly cached) response bytes instead of raw dicts.
+
+    Args:
+        api (SleeperAPI): The client to issue requests through.
+
+    Example:
+        >>> typed = TypedSleeperAPI(api)
+        >>> trades = [t for t in typed.get_league_transactions("1182986456149786624", 3) if t.is_trade]
+        >>> trades[0].draft_picks[0].owner_id
+        4
+    """
+
+    def __init__(self, api: SleeperAPI):
+        self.api = api
+
+    def get_league(self, league_id: str) -> Optional[League]:
+        return decode(self.api._get_bytes(f"/league/{league_id}"), League)
+
+    def get_league_users(self, league_id: str) -> List[User]:
+        return decode_list(self.api._get_bytes(f"/league/{league_id}/users"), User)
+
+    def get_league_rosters(self, league_id: str) -> List[Roster]:
+        return decode_list(self.api._get_bytes(f"/league/{league_id}/rosters"), Roster)
+
+    def get_league_transactions(self, league_id: str, week: int) -> List[Transaction]:
+        return decode_list(self.api._get_bytes(f"/league/{league_id}/transactions/{week}"), Transaction)
+
+    def get_drafts_for_league(self, league_id: str) -> List[Draft]:
+        return decode_list(self.api._get_bytes(f"/league/{league_id}/drafts"), Draft)
+
+    def get_draft(self, draft_id: str) -> Optional[Draft]:
+        return decode(self.api._get_bytes(f"/draft/{draft_id}"), Draft)
+
+    def get_draft_picks(self, draft_id: str) -> List[DraftPick]:
+        return decode_list(self.api._get_bytes(f"/draft/{draft_id}/picks"), DraftPick)
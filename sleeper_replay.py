@@ -0,0 +1,253 @@
+import argparse
+import io
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import quote, unquote, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Offline stand-ins for the Sleeper API. A recording adapter saves every successful response
+# into a fixture directory (one file per request path); a replay adapter or a local HTTP server
+# then serves those fixtures back, optionally with injected latency and errors, so the client
+# and dankest.py can be benchmarked reproducibly with no network access.
+#
+#   python dankest.py --record fixtures                  # capture a real run
+#   python dankest.py --replay fixtures                  # replay in-process
+#   python sleeper_replay.py fixtures --port 8765 --latency 40 --error-rate 0.02
+#   python dankest.py --base-url http://127.0.0.1:8765/v1
+
+# path prefix of BASE ("https://api.sleeper.app/v1"); fixture keys are relative to it
+BASE_PATH = "/v1"
+
+
+class FixtureStore:
+    """
+    Response bodies on disk, keyed by request path relative to BASE.
+
+    "/league/123/transactions/3" is stored as <directory>/league/123/transactions/3.json; a query
+    string is kept in the file name (percent-encoded).
+
+    Args:
+        directory (str): The fixture directory (created on first save).
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    def file_for(self, path: str) -> str:
+        path, _, query = path.partition("?")
+        name = quote(path.strip("/"), safe="/") or "index"
+        if query:
+            name += "%3F" + quote(query, safe="")
+        return os.path.join(self.directory, *name.split("/")) + ".json"
+
+    def load(self, path: str) -> Optional[bytes]:
+        """
+        Get the recorded body for a path, or None if it was never recorded.
+        """
+        try:
+            with open(self.file_for(path), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def save(self, path: str, body: bytes) -> None:
+        file = self.file_for(path)
+        with self._lock:
+            os.makedirs(os.path.dirname(file), exist_ok=True)
+            tmp = f"{file}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(body)
+            os.replace(tmp, file)
+
+
+def request_path(url: str, base_path: str = BASE_PATH) -> str:
+    """
+    Get the fixture key for a request URL: its path relative to the API base, plus any query.
+
+    Example:
+        >>> request_path("https://api.sleeper.app/v1/league/123/rosters")
+        "/league/123/rosters"
+    """
+    parts = urlsplit(url)
+    path = unquote(parts.path)
+    if path.startswith(base_path):
+        path = path[len(base_path):]
+    return f"{path}?{parts.query}" if parts.query else path
+
+
+class FaultInjector:
+    """
+    Injected latency and errors for replayed responses. Thread-safe, and deterministic for a given seed.
+
+    Args:
+        latency (float, optional): Added delay per request in seconds (default is 0).
+        jitter (float, optional): Uniform random extra delay in seconds, [0, jitter) (default is 0).
+        error_rate (float, optional): Fraction of requests answered with a transient error (default is 0).
+        error_statuses (Tuple[int, ...], optional): Statuses to pick injected errors from (default is 429 and 503).
+        seed (int, optional): Random seed, for reproducible runs.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 error_statuses: Tuple[int, ...] = (429, 503), seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def next(self) -> Tuple[float, Optional[int]]:
+        """
+        Draw the delay in seconds and the error status (None for success) for the next request.
+        """
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            status = self._random.choice(self.error_statuses) if self._random.random() < self.error_rate else None
+        return delay, status
+
+
+def _response_for(path: str, store: FixtureStore, faults: Optional[FaultInjector]) -> Tuple[int, bytes, float]:
+    # status, body and delay for a replayed request
+    delay, status = faults.next() if faults is not None else (0.0, None)
+    if status is not None:
+        return status, b'{"error": "injected"}', delay
+    body = store.load(path)
+    if body is None:
+        return 404, b'{"error": "no fixture"}', delay
+    return 200, body, delay
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    A normal HTTP adapter that also saves every 200 response body into a FixtureStore.
+
+    Example:
+        >>> api = SleeperAPI(transport=lambda: RecordingAdapter(FixtureStore("fixtures")))
+    """
+
+    def __init__(self, store: FixtureStore, base_path: str = BASE_PATH, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+        self.base_path = base_path
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        if response.status_code == 200:
+            # reading .content buffers a streamed body; iter_content then serves it from memory
+            self.store.save(request_path(request.url, self.base_path), response.content)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Serve requests from a FixtureStore without touching the network. Unrecorded paths get a 404.
+
+    Example:
+        >>> faults = FaultInjector(latency=0.04, error_rate=0.02, seed=1)
+        >>> api = SleeperAPI(transport=lambda: ReplayAdapter(FixtureStore("fixtures"), faults))
+    """
+
+    def __init__(self, store: FixtureStore, faults: Optional[FaultInjector] = None, base_path: str = BASE_PATH):
+        super().__init__()
+        self.store = store
+        self.faults = faults
+        self.base_path = base_path
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        status, body, delay = _response_for(request_path(request.url, self.base_path), self.store, self.faults)
+        if delay:
+            time.sleep(delay)
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json", "Content-Length": str(len(body))})
+        if status in (429, 503):
+            response.headers["Retry-After"] = "0"
+        response.raw = io.BytesIO(body)
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.reason = "OK" if status == 200 else "Error"
+        return response
+
+    def close(self):
+        pass
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    # set on the per-server subclass built in make_server
+    store: FixtureStore
+    faults: Optional[FaultInjector]
+    base_path: str
+
+    def do_GET(self):
+        status, body, delay = _response_for(request_path(self.path, self.base_path), self.store, self.faults)
+        if delay:
+            time.sleep(delay)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status in (429, 503):
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # one line per request would swamp benchmark output
+        pass
+
+
+def make_server(store: FixtureStore, host: str = "127.0.0.1", port: int = 0,
+                faults: Optional[FaultInjector] = None, base_path: str = BASE_PATH) -> ThreadingHTTPServer:
+    """
+    Build a threaded HTTP server that serves fixtures at the BASE paths (http://host:port/v1/...).
+
+    Args:
+        store (FixtureStore): The recorded responses.
+        host (str, optional): Interface to bind (default is 127.0.0.1).
+        port (int, optional): Port to bind; 0 picks a free one (see server.server_address).
+        faults (FaultInjector, optional): Latency and error injection.
+        base_path (str, optional): Path prefix the fixtures are served under (default is "/v1").
+
+    Example:
+        >>> server = make_server(FixtureStore("fixtures"))
+        >>> threading.Thread(target=server.serve_forever, daemon=True).start()
+        >>> api = SleeperAPI(base_url=f"http://127.0.0.1:{server.server_address[1]}/v1")
+    """
+    handler = type("FixtureHandler", (_FixtureHandler,), {"store": store, "faults": faults, "base_path": base_path})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve recorded Sleeper responses as a local stand-in for the API.')
+    parser.add_argument('fixtures', help='Fixture directory written by dankest.py --record')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Added latency per request in milliseconds (default: 0)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Random extra latency in milliseconds, uniform in [0, jitter) (default: 0)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 429/503 (default: 0)')
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible latency and errors')
+    args = parser.parse_args()
+
+    faults = FaultInjector(args.latency / 1000, args.jitter / 1000, args.error_rate, seed=args.seed)
+    server = make_server(FixtureStore(args.fixtures), args.host, args.port, faults)
+    print(f"Serving {args.fixtures} at http://{args.host}:{server.server_address[1]}{BASE_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
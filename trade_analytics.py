@@ -0,0 +1,174 @@
+import argparse
+import os
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import numpy as np
+
+import sleeper_codec
+
+# League-level summary of valued trades (trades.json): per-team and per-season net value, trade
+# counts, win rate, best and worst trades, and who trades with whom. Trades are flattened once
+# into arrays with one row per team side, and every statistic is a bincount, sort or scatter-add
+# over those arrays, so it stays fast at tens of thousands of trades.
+#
+#   python trade_analytics.py trades.json --output trades_summary.json
+
+
+def _side_values(side: Dict[str, Any], key: str) -> int:
+    return sum(asset.get("value") or 0 for asset in side.get(key, []))
+
+
+def trade_sides(trade_infos: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Flatten trades into parallel arrays with one entry per team side of a trade.
+
+    Returns:
+        Dict[str, Any]: teams (sorted names), seasons (sorted), and arrays trade (index into
+            trade_infos), team and season (indexes into teams and seasons), received, sent and
+            net (values) and time (time_created in milliseconds).
+    """
+    trade_index, team_names, years, received, sent, times = [], [], [], [], [], []
+    for i, trade in enumerate(trade_infos):
+        created = int(trade.get("time_created") or 0)
+        # the calendar year of the trade, which for dynasty leagues is the season it was made for
+        year = datetime.fromtimestamp(created / 1000, timezone.utc).year if created else 0
+        for team, side in trade.items():
+            if team == "time_created":
+                continue
+            trade_index.append(i)
+            # as the key is written to trades.json, so None (an ownerless roster) is "null"
+            team_names.append(sleeper_codec.json_key(team))
+            years.append(year)
+            received.append(_side_values(side, "additions"))
+            sent.append(_side_values(side, "subtractions"))
+            times.append(created)
+
+    teams, team = np.unique(np.array(team_names, dtype=str), return_inverse=True)
+    seasons, season = np.unique(np.array(years, dtype=np.int64), return_inverse=True)
+    received = np.array(received, dtype=np.int64)
+    sent = np.array(sent, dtype=np.int64)
+    return {"teams": teams.tolist(), "seasons": seasons.tolist(),
+            "trade": np.array(trade_index, dtype=np.int64), "team": team.astype(np.int64),
+            "season": season.astype(np.int64), "received": received, "sent": sent,
+            "net": received - sent, "time": np.array(times, dtype=np.int64)}
+
+
+def summarize_trades(trade_infos: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Compute the league summary of valued trades (see dankest.enrich_trades).
+
+    A side wins a trade when it received more value than it sent. In trades between more than
+    two teams, a side's net value is split evenly between its partners in the partner matrix.
+
+    Args:
+        trade_infos (List[Dict[str, Any]]): The trades, as written to trades.json.
+
+    Returns:
+        Dict[str, Any]: trades (count), seasons, teams (name to totals, per-season totals and
+            best and worst trade) and partners (team names, and matrices of trade counts and of
+            the row team's net value in trades with the column team).
+
+    Example:
+        >>> summary = summarize_trades(sleeper_codec.load("trades.json"))
+        >>> summary["teams"]["Goldyman"]["win_rate"]
+        0.5714
+    """
+    sides = trade_sides(trade_infos)
+    teams, seasons = sides["teams"], sides["seasons"]
+    team, season, net, trade = sides["team"], sides["season"], sides["net"], sides["trade"]
+    n_teams, n_seasons = len(teams), len(seasons)
+
+    trades = np.bincount(team, minlength=n_teams)
+    net_value = np.bincount(team, weights=net, minlength=n_teams).astype(np.int64)
+    wins = np.bincount(team, weights=net > 0, minlength=n_teams).astype(np.int64)
+    losses = np.bincount(team, weights=net < 0, minlength=n_teams).astype(np.int64)
+    received = np.bincount(team, weights=sides["received"], minlength=n_teams).astype(np.int64)
+    sent = np.bincount(team, weights=sides["sent"], minlength=n_teams).astype(np.int64)
+
+    # team x season cells as one flat index
+    cell = team * n_seasons + season
+    season_trades = np.bincount(cell, minlength=n_teams * n_seasons).reshape(n_teams, n_seasons)
+    season_net = np.bincount(cell, weights=net, minlength=n_teams * n_seasons).astype(np.int64).reshape(n_teams, n_seasons)
+    season_wins = np.bincount(cell, weights=net > 0, minlength=n_teams * n_seasons).astype(np.int64).reshape(n_teams, n_seasons)
+
+    # sides sorted by team, then net value: each team's worst trade is first in its run, its best last
+    order = np.lexsort((net, team))
+    starts = np.searchsorted(team[order], np.arange(n_teams))
+    worst = order[starts]
+    best = order[starts + trades - 1]
+
+    # every ordered pair of sides of the same trade; sides of a trade are adjacent in the arrays
+    trade_starts = np.flatnonzero(np.r_[True, trade[1:] != trade[:-1]])
+    sizes = np.diff(np.r_[trade_starts, len(trade)])
+    size = np.repeat(sizes, sizes)
+    first = np.repeat(trade_starts, sizes)
+    rows = np.repeat(np.arange(len(trade)), size)
+    cols = np.repeat(first, size) + (np.arange(len(rows)) - np.repeat(np.cumsum(size) - size, size))
+    pairs = rows != cols
+    rows, cols = rows[pairs], cols[pairs]
+    partner_trades = np.zeros((n_teams, n_teams), dtype=np.int64)
+    np.add.at(partner_trades, (team[rows], team[cols]), 1)
+    partner_net = np.zeros((n_teams, n_teams), dtype=np.float64)
+    np.add.at(partner_net, (team[rows], team[cols]), net[rows] / np.maximum(size[rows] - 1, 1))
+
+    def trade_ref(side: int) -> Dict[str, Any]:
+        i = int(trade[side])
+        return {"index": i, "time_created": int(sides["time"][side]), "net_value": int(net[side]),
+                "partners": [sleeper_codec.json_key(name) for name in trade_infos[i]
+                             if name != "time_created" and sleeper_codec.json_key(name) != teams[team[side]]]}
+
+    summary_teams = {}
+    for t, name in enumerate(teams):
+        summary_teams[name] = {
+            "trades": int(trades[t]),
+            "received": int(received[t]),
+            "sent": int(sent[t]),
+            "net_value": int(net_value[t]),
+            "avg_net_value": round(float(net_value[t]) / trades[t], 1),
+            "wins": int(wins[t]),
+            "losses": int(losses[t]),
+            "win_rate": round(float(wins[t]) / trades[t], 4),
+            "best_trade": trade_ref(int(best[t])),
+            "worst_trade": trade_ref(int(worst[t])),
+            "seasons": {str(seasons[s]): {"trades": int(season_trades[t, s]), "net_value": int(season_net[t, s]),
+                                          "wins": int(season_wins[t, s])}
+                        for s in range(n_seasons) if season_trades[t, s]},
+        }
+    return {
+        "trades": len(trade_infos),
+        "seasons": [str(s) for s in seasons],
+        "teams": summary_teams,
+        "partners": {"teams": teams, "trades": partner_trades.tolist(),
+                     "net_value": np.rint(partner_net).astype(np.int64).tolist()},
+    }
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    """
+    Format the per-team totals of a summary as a table, best net value first.
+    """
+    lines = [f"{'team':<24} {'trades':>6} {'net value':>10} {'win rate':>9}"]
+    for name, team in sorted(summary["teams"].items(), key=lambda item: -item[1]["net_value"]):
+        lines.append(f"{name:<24} {team['trades']:>6} {team['net_value']:>10} {team['win_rate']:>9.1%}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize valued trades per team.')
+    parser.add_argument('input_file', nargs='?', default='trades.json', help='Path to the input JSON file (default: trades.json)')
+    parser.add_argument('--output', default='trades_summary.json', help='Where to write the summary (default: trades_summary.json)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input_file):
+        print(f"Error: File '{args.input_file}' not found.")
+        sys.exit(1)
+    summary = summarize_trades(sleeper_codec.load(args.input_file))
+    sleeper_codec.dump(summary, args.output)
+    print(format_summary(summary))
+    print(f"Summary of {summary['trades']} trades written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from sleeper_api_wrapper import SleeperAPI
+
+
+class TradeSyncStore:
+    """
+    Local watermark store for incremental trade syncs, kept as a JSON file.
+
+    For every league it records the trades seen so far, the last synced week and whether the
+    league is frozen (its season is complete, so it never needs to be fetched again).
+
+    Args:
+        path (str): Path of the JSON file (created on first save).
+
+    Example:
+        >>> store = TradeSyncStore("trade_sync.json")
+        >>> all_trades = sync_trades(api, store, ["1204869865995771904", "1063120292207251456"])
+    """
+
+    def __init__(self, path: str = "trade_sync.json"):
+        self.path = path
+        self.leagues: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.leagues = json.load(f).get("leagues", {})
+
+    def league(self, league_id: str) -> Dict[str, Any]:
+        """
+        Get the sync entry for a league, creating an empty one if needed.
+        """
+        return self.leagues.setdefault(league_id, {"frozen": False, "last_week": 0, "trades": []})
+
+    def trades(self, league_id: str) -> List[Dict[str, Any]]:
+        """
+        Get every trade synced so far for a league.
+        """
+        return self.league(league_id)["trades"]
+
+    def merge(self, league_id: str, trades: List[Dict[str, Any]]) -> int:
+        """
+        Add trades not seen before (by transaction_id) to a league. Returns how many were new.
+        """
+        entry = self.league(league_id)
+        seen = {trade.get("transaction_id") for trade in entry["trades"]}
+        new_trades = [trade for trade in trades if trade.get("transaction_id") not in seen]
+        entry["trades"].extend(new_trades)
+        return len(new_trades)
+
+    def save(self) -> None:
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"leagues": self.leagues}, f)
+        os.replace(tmp_path, self.path)
+
+
+def sync_trades(api: SleeperAPI, store: TradeSyncStore, league_ids: List[str], max_week: int = 17,
+                max_workers: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Bring the store up to date and return every trade per league, like dankest.list_all_trades.
+
+    Frozen leagues are not touched. A league whose status is "complete" is fetched once in full
+    and then frozen. The league of the current season is fetched from its last synced week up to
+    the current NFL week (the last synced week is fetched again since it may have grown). Any
+    other league is fetched in full.
+
+    Args:
+        api (SleeperAPI): The client.
+        store (TradeSyncStore): The watermark store; it is saved before returning.
+        league_ids (List[str]): The league IDs to sync (e.g. every season of one league).
+        max_week (int, optional): The last week to consider (default is 17).
+        max_workers (int, optional): Concurrent requests (default is the client's max_workers).
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: League ID to all of its trades, old and new.
+    """
+    state = api.get_state()
+    for league_id in league_ids:
+        entry = store.league(league_id)
+        if entry["frozen"]:
+            continue
+        league = api.get_league(league_id) or {}
+        complete = league.get("status") == "complete"
+        current = str(league.get("season")) == str(state.get("season"))
+        if current and not complete:
+            last_week = min(max(int(state.get("leg") or state.get("week") or 1), 1), max_week)
+            weeks = range(max(entry["last_week"], 1), last_week + 1)
+        else:
+            # a finished season, or one the NFL state doesn't describe yet: fetch it all
+            last_week = max_week
+            weeks = range(1, max_week + 1)
+        transactions = api.collect_transactions([league_id], weeks, max_workers=max_workers)[league_id]
+        new_count = store.merge(league_id, [trade for trade in transactions if trade['type'] == 'trade'])
+        if current or complete:
+            entry["last_week"] = last_week
+        entry["frozen"] = complete
+        print(f"Synced league {league_id} weeks {weeks.start}-{last_week}: {new_count} new trades")
+    store.save()
+    return {league_id: store.trades(league_id) for league_id in league_ids}
@@ -0,0 +1,251 @@
+import csv
+import difflib
+import os
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import sleeper_codec
+
+# where the KTC name -> Sleeper player_id crosswalk is kept between runs
+DEFAULT_CROSSWALK_PATH = os.environ.get("SLEEPER_KTC_CROSSWALK", "ktc_crosswalk.json")
+
+# similarity (difflib ratio) a fuzzy match must reach; only used for names with no exact match
+FUZZY_CUTOFF = 0.85
+
+_SUFFIX = re.compile(r'\s+(Jr\.?|Sr\.?|III|II|IV|V)(\s|$)', re.IGNORECASE)
+_NON_WORD = re.compile(r'[^\w\s]')
+_PICK = re.compile(r'^(\d{4}) (Early|Mid|Late) (\d)(?:st|nd|rd|th)$', re.IGNORECASE)
+
+
+def normalize_name(name):
+    """Removes suffixes like Jr., III, etc. and lowercases for comparison."""
+    if not name:
+        return ""
+    name = _SUFFIX.sub('', name)
+    name = _NON_WORD.sub('', name)
+    return name.strip().lower()
+
+
+def load_ktc_rows(csv_path: str, value_column: str = "Value") -> List[Dict[str, Any]]:
+    """
+    Read a KTC export (see ktc_scraper) into rows of name, position, team and value.
+
+    The first column holds the name under an "Updated <date>" header, so it is read by position.
+    value_column picks another value column, e.g. "FantasyCalc Value" in ktc_scraper/main.py exports.
+    """
+    rows = []
+    if not os.path.exists(csv_path):
+        print(f"Warning: KTC CSV not found at {csv_path}")
+        return rows
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        columns = {name: i for i, name in enumerate(header)}
+        for row in reader:
+            if not row:
+                continue
+            try:
+                value = int(row[columns[value_column]])
+            except (KeyError, IndexError, ValueError):
+                value = 0
+            rows.append({
+                "name": row[0],
+                "position": row[columns["Position"]] if "Position" in columns else "",
+                "team": row[columns["Team"]] if "Team" in columns else "",
+                "value": value,
+            })
+    return rows
+
+
+class Crosswalk:
+    """
+    Persisted mapping from KTC players to Sleeper player IDs.
+
+    Entries are keyed by normalized name and position and record how they were resolved
+    ("exact", "position", "team", "fuzzy" or "manual"). Manual entries (edit the file by hand to
+    fix a bad match) are always trusted; others are re-checked against the players table.
+
+    Args:
+        path (str, optional): The JSON file (default is ktc_crosswalk.json, or SLEEPER_KTC_CROSSWALK).
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_CROSSWALK_PATH):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        # size of the players table unmatched names were last tried against
+        self.players_seen = 0
+        if path and os.path.exists(path):
+            data = sleeper_codec.load(path)
+            self.entries = data.get("entries", {})
+            self.players_seen = data.get("players_seen", 0)
+
+    @staticmethod
+    def key(name: str, position: str) -> str:
+        return f"{normalize_name(name)}|{position.upper()}"
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        tmp_path = self.path + ".tmp"
+        sleeper_codec.dump({"players_seen": self.players_seen, "entries": self.entries}, tmp_path)
+        os.replace(tmp_path, self.path)
+
+
+class ValueIndex:
+    """
+    KTC values keyed by Sleeper player_id (and (season, round) for picks), built once per KTC
+    snapshot so valuing a trade asset is a dict lookup.
+
+    KTC names are matched to Sleeper players through a Crosswalk: cached matches first, then an
+    exact normalized-name match (narrowed by position and team on collisions), and fuzzy
+    matching only for names still unresolved. Names that cannot be matched are kept in unresolved.
+
+    Args:
+        player_values (Dict[str, int]): player_id to value.
+        pick_values (Dict[Tuple[str, int], int]): (season, round) to the value of a mid pick.
+        unresolved (List[str], optional): KTC names with no Sleeper match.
+
+    Example:
+        >>> values = ValueIndex.from_csv("ktc_scraper/ktc.csv", api.player_records())
+        >>> values.player_value("4046")
+        9986
+        >>> values.pick_value("2026", 1)
+        6120
+    """
+
+    def __init__(self, player_values: Dict[str, int], pick_values: Dict[Tuple[str, int], int],
+                 unresolved: Optional[List[str]] = None):
+        self.player_values = player_values
+        self.pick_values = pick_values
+        self.unresolved = unresolved or []
+
+    @classmethod
+    def build(cls, ktc_rows: List[Dict[str, Any]], players: Iterable[Dict[str, Any]],
+              crosswalk: Optional[Crosswalk] = None, trust_crosswalk: bool = False,
+              match_new: bool = True) -> "ValueIndex":
+        """
+        Build the index from KTC rows (see load_ktc_rows) and Sleeper player records (see
+        SleeperAPI.player_records), updating and saving the crosswalk.
+
+        With trust_crosswalk, crosswalk entries are used without checking them against the
+        players table, and players is only iterated if some KTC name has no entry yet (pass a
+        lazy iterable such as SleeperAPI.player_records() to avoid loading it at all). With
+        match_new=False as well, names with no entry are left unresolved instead, so players is
+        never read (e.g. when loading it could mean fetching the players table from Sleeper).
+        """
+        crosswalk = crosswalk if crosswalk is not None else Crosswalk(None)
+        by_name: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        known_ids = set()
+        loaded = False
+
+        def load_players() -> None:
+            nonlocal loaded
+            if loaded:
+                return
+            loaded = True
+            for player in players:
+                known_ids.add(player["player_id"])
+                name = normalize_name(player.get("full_name"))
+                if name:
+                    by_name[name].append(player)
+
+        retry_unmatched = False
+        changed = False
+        if not trust_crosswalk:
+            load_players()
+            # unmatched names are only worth retrying once the players table has changed
+            retry_unmatched = len(known_ids) != crosswalk.players_seen
+            crosswalk.players_seen = len(known_ids)
+            changed = retry_unmatched
+
+        player_values: Dict[str, int] = {}
+        pick_values: Dict[Tuple[str, int], int] = {}
+        unresolved = []
+        for row in ktc_rows:
+            pick = _PICK.match(row["name"].strip())
+            if pick:
+                # only mid picks are used, as a stand-in for a pick whose slot is not known yet
+                if pick.group(2).lower() == "mid":
+                    pick_values[(pick.group(1), int(pick.group(3)))] = row["value"]
+                continue
+            key = Crosswalk.key(row["name"], row["position"])
+            entry = crosswalk.entries.get(key)
+            if entry is None and trust_crosswalk and not match_new:
+                unresolved.append(row["name"])
+                continue
+            stale = entry is None or (not trust_crosswalk and entry["method"] != "manual" and entry["player_id"] not in known_ids
+                                      and (entry["player_id"] is not None or retry_unmatched))
+            if stale:
+                load_players()
+                entry = _resolve(row, by_name)
+                crosswalk.entries[key] = entry
+                changed = True
+            if entry["player_id"] is None:
+                unresolved.append(row["name"])
+            else:
+                player_values[entry["player_id"]] = row["value"]
+        if changed:
+            crosswalk.save()
+        return cls(player_values, pick_values, unresolved)
+
+    @classmethod
+    def from_csv(cls, csv_path: str, players: Iterable[Dict[str, Any]],
+                 crosswalk_path: Optional[str] = DEFAULT_CROSSWALK_PATH, trust_crosswalk: bool = False,
+                 match_new: bool = True) -> "ValueIndex":
+        return cls.build(load_ktc_rows(csv_path), players, Crosswalk(crosswalk_path), trust_crosswalk, match_new)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-friendly form of the index (pick keys become "season:round").
+        """
+        return {"players": self.player_values,
+                "picks": {f"{season}:{round_num}": value for (season, round_num), value in self.pick_values.items()},
+                "unresolved": self.unresolved}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ValueIndex":
+        picks = {}
+        for key, value in data["picks"].items():
+            season, round_num = key.split(":")
+            picks[(season, int(round_num))] = value
+        return cls(data["players"], picks, data.get("unresolved"))
+
+    def player_value(self, player_id: str) -> Optional[int]:
+        """
+        Get a player's value, or None if they have no KTC match.
+        """
+        return self.player_values.get(player_id)
+
+    def pick_value(self, season: str, round_num: int) -> int:
+        """
+        Get the value of a mid pick in a season and round (0 if KTC does not list it).
+        """
+        return self.pick_values.get((str(season), int(round_num)), 0)
+
+
+def _resolve(row: Dict[str, Any], by_name: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    # match one KTC row against the players table: exact name, then fuzzy
+    name = normalize_name(row["name"])
+    method = "exact"
+    candidates = by_name.get(name, [])
+    if not candidates:
+        close = difflib.get_close_matches(name, by_name.keys(), n=1, cutoff=FUZZY_CUTOFF)
+        if close:
+            candidates = by_name[close[0]]
+            method = "fuzzy"
+    position = (row.get("position") or "").upper()
+    if len(candidates) > 1 and position:
+        narrowed = [p for p in candidates if (p.get("position") or "").upper() == position]
+        if narrowed:
+            candidates = narrowed
+            method = "position" if method == "exact" else method
+    team = (row.get("team") or "").upper()
+    if len(candidates) > 1 and team:
+        narrowed = [p for p in candidates if (p.get("team") or "").upper() == team]
+        if narrowed:
+            candidates = narrowed
+            method = "team" if method != "fuzzy" else method
+    if len(candidates) != 1:
+        return {"player_id": None, "method": "ambiguous" if candidates else "unmatched", "name": row["name"]}
+    return {"player_id": candidates[0]["player_id"], "method": method, "name": row["name"]}